@@ -8,28 +8,30 @@ Run:
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import biosimulant as biosim
 
 
 class Eye(biosim.BioModule):
     def __init__(self):
-        self._outputs = {}
+        self._outputs = MappingProxyType({})
 
     def outputs(self):
         return {"visual_stream": biosim.SignalSpec.scalar(dtype="float64")}
 
     def advance_window(self, start: float, end: float) -> None:
-        self._outputs = {
+        self._outputs = MappingProxyType({
             "visual_stream": biosim.ScalarSignal(source="eye", name="visual_stream", value=end, emitted_at=end)
-        }
+        })
 
     def get_outputs(self):
-        return dict(self._outputs)
+        return self._outputs
 
 
 class LGN(biosim.BioModule):
     def __init__(self):
-        self._outputs = {}
+        self._outputs = MappingProxyType({})
 
     def inputs(self):
         return {"retina": biosim.SignalSpec.scalar(dtype="float64", max_age=0.2)}
@@ -40,15 +42,15 @@ class LGN(biosim.BioModule):
     def set_inputs(self, signals):
         if "retina" in signals:
             sig = signals["retina"]
-            self._outputs = {
+            self._outputs = MappingProxyType({
                 "thalamus": biosim.ScalarSignal(source="lgn", name="thalamus", value=sig.value, emitted_at=sig.emitted_at)
-            }
+            })
 
     def advance_window(self, start: float, end: float) -> None:
         return
 
     def get_outputs(self):
-        return dict(self._outputs)
+        return self._outputs
 
 
 class SC(biosim.BioModule):
@@ -11,6 +11,8 @@ Or without installing:
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import biosimulant as biosim
 
 
@@ -32,13 +34,15 @@ class Eye(biosim.BioModule):
     """Publishes a vision signal each step."""
 
     def __init__(self):
-        self._outputs = {}
+        self._outputs = MappingProxyType({})
 
     def outputs(self):
         return {"vision": biosim.SignalSpec.record(schema={"photon": "bool"})}
 
     def advance_window(self, start: float, end: float) -> None:
-        self._outputs = {
+        # A read-only view lets get_outputs hand the mapping out without
+        # copying it every window.
+        self._outputs = MappingProxyType({
             "vision": biosim.RecordSignal(
                 source="eye",
                 name="vision",
@@ -46,17 +50,17 @@ class Eye(biosim.BioModule):
                 emitted_at=end,
                 spec=self.outputs()["vision"],
             )
-        }
+        })
 
     def get_outputs(self):
-        return dict(self._outputs)
+        return self._outputs
 
 
 class LGN(biosim.BioModule):
     """Receives Eye.vision and relays to thalamus channel."""
 
     def __init__(self):
-        self._outputs = {}
+        self._outputs = MappingProxyType({})
 
     def inputs(self):
         return {"vision": biosim.SignalSpec.record(schema={"photon": "bool"})}
@@ -66,7 +70,7 @@ class LGN(biosim.BioModule):
 
     def set_inputs(self, signals):
         if "vision" in signals:
-            self._outputs = {
+            self._outputs = MappingProxyType({
                 "thalamus": biosim.RecordSignal(
                     source="lgn",
                     name="thalamus",
@@ -74,13 +78,13 @@ class LGN(biosim.BioModule):
                     emitted_at=signals["vision"].emitted_at,
                     spec=self.outputs()["thalamus"],
                 )
-            }
+            })
 
     def advance_window(self, start: float, end: float) -> None:
         return
 
     def get_outputs(self):
-        return dict(self._outputs)
+        return self._outputs
 
 
 class SuperiorColliculus(biosim.BioModule):
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import importlib
 from types import ModuleType
+from typing import TYPE_CHECKING
 
 from .__about__ import __version__
 from .world import BioWorld, WorldEvent
@@ -42,22 +43,44 @@ from .pack import (
     unpack_package,
     validate_package,
 )
-from .cloud import (
-    ApiError,
-    Artifact,
-    AsyncClient,
-    AuthenticationError,
-    Client,
-    InsufficientCreditsError,
-    RateLimitError,
-    Run,
-    RunFailed,
-    RunResult,
-    RunTimeout,
-    ValidationError,
-    verify_webhook_signature,
+
+# The cloud client pulls in httpx; resolve its exports on first access (see
+# __getattr__) so importing biosim for local simulation stays cheap.
+_CLOUD_EXPORTS = frozenset(
+    {
+        "ApiError",
+        "Artifact",
+        "AsyncClient",
+        "AuthenticationError",
+        "Client",
+        "InsufficientCreditsError",
+        "RateLimitError",
+        "Run",
+        "RunFailed",
+        "RunResult",
+        "RunTimeout",
+        "ValidationError",
+        "verify_webhook_signature",
+    }
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .cloud import (
+        ApiError,
+        Artifact,
+        AsyncClient,
+        AuthenticationError,
+        Client,
+        InsufficientCreditsError,
+        RateLimitError,
+        Run,
+        RunFailed,
+        RunResult,
+        RunTimeout,
+        ValidationError,
+        verify_webhook_signature,
+    )
+
 __all__ = [
     "__version__",
     "BioWorld",
@@ -115,10 +138,19 @@ def __getattr__(name: str) -> ModuleType:
     # Lazily import optional namespaces so `import biosim` does not require extras.
     if name == "onnx":
         return importlib.import_module(".onnx", __name__)
+    if name == "cloud":
+        return importlib.import_module(".cloud", __name__)
+    if name in _CLOUD_EXPORTS:
+        value = getattr(importlib.import_module(".cloud", __name__), name)
+        globals()[name] = value
+        return value
     if name == "OnnxClassifierModule":
-        return getattr(importlib.import_module(".onnx", __name__), name)
+        value = getattr(importlib.import_module(".onnx", __name__), name)
+        # Bind it so later lookups hit the module dict instead of __getattr__.
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def __dir__() -> list[str]:
-    return sorted([*__all__, "onnx"])
+    return sorted([*__all__, "cloud", "onnx"])
@@ -47,7 +47,7 @@ if TYPE_CHECKING:
     from .world import BioWorld
 
 from .__about__ import __version__
-from .labs_serve import serve_lab
+from ._yaml import safe_yaml_load
 from .managed_runtime import (
     run_labs_serve_with_managed_python,
     run_package_with_managed_python,
@@ -88,6 +88,15 @@ from .workspace import (
 )
 
 
+def serve_lab(*args: Any, **kwargs: Any) -> Any:
+    """Start the local lab server, importing its web stack on first use."""
+    # The server pulls in FastAPI and uvicorn; keep them off the startup path
+    # of every other command.
+    from .labs_serve import serve_lab as _serve_lab
+
+    return _serve_lab(*args, **kwargs)
+
+
 _ARGCOMPLETE_ENV = "_ARGCOMPLETE"
 _TOP_LEVEL_COMPLETION_COMMANDS = ("labs",)
 
@@ -201,7 +210,7 @@ def load_config(path: Path) -> Dict[str, Any]:
             print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
             sys.exit(1)
         with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return safe_yaml_load(yaml, f) or {}
     if suffix in {".toml", ".tml"}:
         try:
             import tomllib  # type: ignore
@@ -224,8 +233,10 @@ def create_world(config: Dict[str, Any] | None = None, communication_step: float
     import biosim
 
     config = config or {}
-    runtime = config.get("runtime") if isinstance(config.get("runtime"), dict) else {}
-    step = communication_step if communication_step is not None else runtime.get("communication_step")
+    runtime = config.get("runtime")
+    step = communication_step
+    if step is None and isinstance(runtime, dict):
+        step = runtime.get("communication_step")
     if step is None:
         raise ValueError("runtime.communication_step is required")
     return biosim.BioWorld(communication_step=float(step))
@@ -1523,7 +1534,7 @@ def _load_structured_file(path: Path) -> Any:
         raise PackageError(
             "Structured lab input requires PyYAML. Install with: pip install pyyaml"
         ) from exc
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    return safe_yaml_load(yaml, path.read_text(encoding="utf-8"))
 
 
 def _print_workspace_result(payload: dict[str, Any], *, json_output: bool) -> None:
@@ -0,0 +1,16 @@
+"""Shared PyYAML loading for manifests, configs and lock files."""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any
+
+
+def safe_yaml_load(yaml: ModuleType, stream: Any) -> Any:
+    """Parse ``stream`` with PyYAML's safe loader.
+
+    Callers import ``yaml`` themselves so each keeps its own missing-dependency
+    error. The libyaml-backed ``CSafeLoader`` is preferred when PyYAML was built
+    with it.
+    """
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
@@ -380,6 +380,13 @@ class GeneratedCellMLModel:
         return _to_list(variables)
 
 
+def _first_index(names: list[str]) -> dict[str, int]:
+    index: dict[str, int] = {}
+    for position, name in enumerate(names):
+        index.setdefault(name, position)
+    return index
+
+
 def _default_generated_module_name(cache_key: str) -> str:
     return f"_biosim_cellml_{cache_key[:24]}"
 
@@ -407,6 +414,7 @@ class LibCellMLBioModule(StatefulBioModule):
     _ENABLE_PARAMETER_OVERRIDES = False
     _ENABLE_INITIAL_CONDITIONS = False
     _TIME_ROW_KEY = "t"
+    _SOLVER_METHOD = "RK45"
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -446,9 +454,12 @@ class LibCellMLBioModule(StatefulBioModule):
         self._observables: list[str] = list(self._OBSERVABLES or [])
         self._state_names: list[str] = []
         self._variable_names: list[str] = []
+        self._state_index: dict[str, int] = {}
+        self._variable_index: dict[str, int] = {}
         self._variable_labels: dict[str, str] = {}
         self._variable_units: dict[str, str] = {}
         self._history: list[dict[str, float]] = []
+        self._peak_cache: Optional[tuple[Any, ...]] = None
         self._time = 0.0
 
     def setup(self, config: Optional[dict[str, Any]] = None) -> None:
@@ -456,6 +467,8 @@ class LibCellMLBioModule(StatefulBioModule):
         self._generated = GeneratedCellMLModel(module)
         self._state_names = self._generated.state_names()
         self._variable_names = self._generated.variable_names()
+        self._state_index = _first_index(self._state_names)
+        self._variable_index = _first_index(self._variable_names)
         self._variable_labels = self._generated.labels()
         self._variable_units = self._generated.units()
         self._states, self._rates, self._variables = self._generated.initialise_state()
@@ -732,11 +745,11 @@ class LibCellMLBioModule(StatefulBioModule):
         return self._variable_names[: self._MAX_DEFAULT_OBSERVABLES]
 
     def _set_variable_value(self, name: str, value: float, *, allow_state: bool) -> None:
-        if allow_state and name in self._state_names:
-            self._states[self._state_names.index(name)] = float(value)
+        if allow_state and name in self._state_index:
+            self._states[self._state_index[name]] = float(value)
             return
-        if name in self._variable_names:
-            self._variables[self._variable_names.index(name)] = float(value)
+        if name in self._variable_index:
+            self._variables[self._variable_index[name]] = float(value)
 
     def _value_for_name(self, name: str, row: Mapping[str, float] | None = None) -> float:
         if row is not None:
@@ -745,10 +758,10 @@ class LibCellMLBioModule(StatefulBioModule):
                 return float(row[row_key])
             if name in row:
                 return float(row[name])
-        if name in self._state_names:
-            return float(self._states[self._state_names.index(name)])
-        if name in self._variable_names:
-            return float(self._variables[self._variable_names.index(name)])
+        if name in self._state_index:
+            return float(self._states[self._state_index[name]])
+        if name in self._variable_index:
+            return float(self._variables[self._variable_index[name]])
         return 0.0
 
     def _row_key(self, source_name: str) -> str:
@@ -759,6 +772,7 @@ class LibCellMLBioModule(StatefulBioModule):
     def _simulate_window(self, start: float, end: float) -> list[dict[str, float]]:
         if self._generated is None:
             return []
+        solver_kwargs: dict[str, Any] = {}
         if self._solver_override is not None:
             solver = self._solver_override
         else:
@@ -767,27 +781,51 @@ class LibCellMLBioModule(StatefulBioModule):
             except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency.
                 raise _optional_import_error("scipy") from exc
             solver = solve_ivp
+            solver_kwargs["method"] = self._SOLVER_METHOD
         n_steps = max(2, int(math.ceil((end - start) / self.integration_step)) + 1)
         t_eval = [start + (end - start) * i / (n_steps - 1) for i in range(n_steps)]
 
+        # The solver calls ``rhs`` many times per window, so bind everything it
+        # needs up front and call the generated ``compute_rates`` directly.
+        compute_rates = self._generated.compute_rates
+        state_count = self._generated.state_count
+        window_variables = list(self._variables)
+
         def rhs(t: float, y: Any) -> list[float]:
-            states = _to_list(y)
-            return self._generated.rates(float(t), states, list(self._variables))
+            states = y.tolist() if hasattr(y, "tolist") else list(y)
+            rates = [0.0] * state_count
+            compute_rates(float(t), states, rates, window_variables[:])
+            return rates
 
-        result = solver(rhs, (float(start), float(end)), list(self._states), t_eval=t_eval)
+        result = solver(rhs, (float(start), float(end)), list(self._states), t_eval=t_eval, **solver_kwargs)
         if not getattr(result, "success", False):
             message = getattr(result, "message", "unknown solver failure")
             raise CellMLRuntimeError(f"CellML solver failed: {message}")
 
         y_values = getattr(result, "y", [])
         times = _to_list(getattr(result, "t", t_eval))
+        # Transpose the (state, time) solution once instead of indexing it
+        # element by element for every sample.
+        expected_states = len(self._states)
+        state_rows = y_values[:expected_states]
+        if not expected_states:
+            columns = [[] for _ in times]
+        elif hasattr(state_rows, "T") and hasattr(state_rows, "tolist"):
+            columns = state_rows.T.tolist()
+        else:
+            columns = [[float(value) for value in column] for column in zip(*state_rows)]
+        if len(columns) < len(times) or any(len(column) != expected_states for column in columns):
+            raise CellMLRuntimeError(
+                f"CellML solver returned {len(state_rows)} state rows over {len(columns)} samples; "
+                f"expected {expected_states} states at each of {len(times)} times"
+            )
         rows: list[dict[str, float]] = []
         for col, t in enumerate(times):
             if rows and abs(t - rows[-1]["t"]) < 1e-12:
                 continue
             if self._history and col == 0 and abs(t - self._history[-1]["t"]) < 1e-12:
                 continue
-            states = [float(y_values[index][col]) for index in range(len(self._states))]
+            states = columns[col]
             variables = self._generated.variables_at(float(t), states, list(self._variables))
             row = self._row_from_values(float(t), states, variables)
             rows.append(row)
@@ -815,15 +853,25 @@ class LibCellMLBioModule(StatefulBioModule):
     def _public_state_values(self, latest: Mapping[str, float]) -> dict[str, float]:
         return {self._public_observable_name(name): self._value_for_name(name, latest) for name in self._observables}
 
+    def _history_column(self, name: str) -> list[float]:
+        """Return ``name`` for every history row, resolving its row key once."""
+
+        row_key = self._row_key(name)
+        return [
+            float(row[row_key]) if row_key in row else self._value_for_name(name, row)
+            for row in self._history
+        ]
+
     def _public_trajectory(self) -> dict[str, Any]:
         series = []
+        times = [float(row.get("t", 0.0)) for row in self._history]
         for raw_name in self._observables:
             public_name = self._public_observable_name(raw_name)
-            points = []
-            for row in self._history:
-                value = self._value_for_name(raw_name, row)
-                if math.isfinite(value):
-                    points.append([float(row.get("t", 0.0)), float(value)])
+            points = [
+                [t, value]
+                for t, value in zip(times, self._history_column(raw_name))
+                if math.isfinite(value)
+            ]
             if len(points) >= 2:
                 series.append({"name": public_name, "source": raw_name, "points": points})
         return {
@@ -854,7 +902,7 @@ class LibCellMLBioModule(StatefulBioModule):
             for name in self._observables
         }
         biggest_change = max(changes, key=changes.get)
-        peaks = {name: max(self._value_for_name(name, point) for point in self._history) for name in self._observables}
+        peaks = dict(zip(self._observables, self._history_peaks()))
         biggest_peak = max(peaks, key=peaks.get)
         return {
             "duration_simulated": float(t),
@@ -865,6 +913,42 @@ class LibCellMLBioModule(StatefulBioModule):
             "peak_value": float(peaks[biggest_peak]),
         }
 
+    def _history_peaks(self) -> list[float]:
+        """Return the maximum of each observable over history, in observable order.
+
+        Peaks are kept in a list aligned with ``self._observables`` and folded
+        forward over rows appended since the previous call; a reset, trim, or
+        change of observables falls back to a full rescan.
+        """
+        history = self._history
+        observables = tuple(self._observables)
+        cache = self._peak_cache
+        if (
+            cache is not None
+            and cache[0] is history
+            and cache[1] is history[0]
+            and cache[2] == observables
+            and cache[3] <= len(history)
+        ):
+            start, peaks = cache[3], cache[4]
+        else:
+            start, peaks = 0, []
+        row_keys = [self._row_key(name) for name in observables]
+        for index in range(start, len(history)):
+            row = history[index]
+            values = [
+                float(row[row_key]) if row_key in row else self._value_for_name(name, row)
+                for name, row_key in zip(observables, row_keys)
+            ]
+            if not peaks:
+                peaks = values
+                continue
+            for position, value in enumerate(values):
+                if value > peaks[position]:
+                    peaks[position] = value
+        self._peak_cache = (history, history[0], observables, len(history), peaks)
+        return list(peaks)
+
     def _headline_value(self, source_id: str, latest: Mapping[str, float], t: float) -> float:
         window_start = float(t) - self._HEADLINE_WINDOW_S
         row_key = self._row_key(source_id)
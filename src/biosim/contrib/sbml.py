@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
 import math
 from pathlib import Path
 import sys
@@ -21,6 +24,8 @@ from biosim.signals import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 ParameterInput = tuple[str, float, str, str]
 MultiplierInput = tuple[list[str], float, str, str]
 HeadlineOutput = tuple[str, str, str]
@@ -29,10 +34,69 @@ HeadlineOutput = tuple[str, str, str]
 def read_sbml_text(path: Path) -> str:
     """Read SBML XML with a conservative fallback for legacy BioModels files."""
 
+    data = path.read_bytes()
     try:
-        return path.read_text(encoding="utf-8")
+        return data.decode("utf-8")
     except UnicodeDecodeError:
-        return path.read_text(encoding="latin-1")
+        return data.decode("latin-1")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_sbml_root(path: str, mtime_ns: int, size: int) -> Optional[ET.Element]:
+    """Parse an SBML file once per on-disk revision; callers must not mutate it."""
+
+    try:
+        return ET.parse(path).getroot()
+    except (ET.ParseError, OSError):
+        return None
+
+
+def _load_sbml_root(path: Path) -> Optional[ET.Element]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _parse_sbml_root(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Serialized RoadRunner state per SBML source, so later loads of the same
+# model restore the compiled state instead of parsing and JIT-compiling again.
+_RUNNER_STATE_CACHE: dict[str, tuple[type, Any]] = {}
+_RUNNER_STATE_CACHE_SIZE = 16
+
+# RoadRunner id listings whose values make up the model state (reaction ids
+# are rates derived from it, so they are readable but not restorable).
+_STATE_ID_GETTERS = (
+    "getFloatingSpeciesIds",
+    "getBoundarySpeciesIds",
+    "getGlobalParameterIds",
+    "getCompartmentIds",
+)
+
+
+def _load_runner(te: Any, source: str, sbml_text: str) -> Any:
+    """Return a Tellurium runner for ``source``, reusing saved state for ``sbml_text``."""
+
+    key = hashlib.sha256(sbml_text.encode("utf-8")).hexdigest()
+    cached = _RUNNER_STATE_CACHE.get(key)
+    if cached is not None:
+        runner_cls, state = cached
+        try:
+            runner = runner_cls()
+            runner.loadStateS(state)
+            return runner
+        except Exception:  # noqa: BLE001 - stale or incompatible state, reload below.
+            _RUNNER_STATE_CACHE.pop(key, None)
+    runner = te.loadSBMLModel(source)
+    if callable(getattr(runner, "saveStateS", None)) and callable(getattr(runner, "loadStateS", None)):
+        try:
+            state = runner.saveStateS()
+        except Exception:  # noqa: BLE001 - caching is best effort.
+            return runner
+        if len(_RUNNER_STATE_CACHE) >= _RUNNER_STATE_CACHE_SIZE:
+            _RUNNER_STATE_CACHE.pop(next(iter(_RUNNER_STATE_CACHE)))
+        _RUNNER_STATE_CACHE[key] = (type(runner), state)
+    return runner
 
 
 def patch_uninitialised_parameters(xml_text: str) -> tuple[str, list[tuple[str, str]]]:
@@ -150,14 +214,30 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                 cls._BIOSIM_SUBCLASS_FILE = subclass_file
                 break
 
-    def __init__(self, model_path: str, integration_step: float = 1.0) -> None:
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        integration_step: float = 1.0,
+        *,
+        sbml_text: Optional[str] = None,
+    ) -> None:
+        """Wrap an SBML model read from ``model_path`` or given inline as ``sbml_text``.
+
+        Inline SBML is handed straight to Tellurium and never touches disk.
+        """
+
+        if model_path is None and sbml_text is None:
+            raise ValueError("TelluriumSBMLBioModule requires model_path or sbml_text")
         super().__init__(integration_step=integration_step)
-        subclass_module = sys.modules.get(self.__class__.__module__)
-        subclass_file = getattr(subclass_module, "__file__", None)
-        if not subclass_file:
-            subclass_file = self._BIOSIM_SUBCLASS_FILE
-        base_dir = Path(subclass_file).resolve().parent.parent if subclass_file else Path.cwd()
-        self._model_path = (base_dir / model_path).resolve()
+        self._model_path: Optional[Path] = None
+        if model_path is not None:
+            subclass_module = sys.modules.get(self.__class__.__module__)
+            subclass_file = getattr(subclass_module, "__file__", None)
+            if not subclass_file:
+                subclass_file = self._BIOSIM_SUBCLASS_FILE
+            base_dir = Path(subclass_file).resolve().parent.parent if subclass_file else Path.cwd()
+            self._model_path = (base_dir / model_path).resolve()
+        self._sbml_text = sbml_text
         self._runner: Any = None
         self._observables, _, _ = self._discover_observables_from_xml()
         if self._OBSERVABLES is not None:
@@ -166,13 +246,33 @@ class TelluriumSBMLBioModule(StatefulBioModule):
         self._history: list[dict[str, float]] = []
         self._patches_applied: list[tuple[str, str]] = []
         self._param_baselines: dict[str, float] = {}
+        self._peak_cache: Optional[tuple[Any, ...]] = None
+        self._model_ids: Optional[frozenset[str]] = None
+        self._writable_ids: Optional[frozenset[str]] = None
+        self._ignored_override_ids: set[str] = set()
+        self._output_specs_cache: Optional[tuple[tuple[Any, ...], dict[str, SignalSpec]]] = None
 
     def setup(self, config: Optional[dict[str, Any]] = None) -> None:
-        import tellurium as te
-
-        xml_text = read_sbml_text(self._model_path)
-        patched_text, self._patches_applied = patch_uninitialised_parameters(xml_text)
-        self._runner = te.loadSBMLModel(patched_text if self._patches_applied else str(self._model_path))
+        runner = self._runner
+        if runner is not None and hasattr(runner, "resetAll"):
+            # Re-running setup (every BioWorld.setup does) only needs the
+            # compiled model back at its initial values, not a fresh load.
+            runner.resetAll()
+        elif self._sbml_text is not None:
+            import tellurium as te
+
+            patched_text, self._patches_applied = patch_uninitialised_parameters(self._sbml_text)
+            self._runner = _load_runner(te, patched_text, patched_text)
+        else:
+            import tellurium as te
+
+            xml_text = read_sbml_text(self._model_path)
+            patched_text, self._patches_applied = patch_uninitialised_parameters(xml_text)
+            source = patched_text if self._patches_applied else str(self._model_path)
+            self._runner = _load_runner(te, source, patched_text)
+        self._model_ids = self._collect_model_ids()
+        state_ids = self._list_model_ids(_STATE_ID_GETTERS)
+        self._writable_ids = frozenset(state_ids) if state_ids is not None else None
         self._capture_multiplier_baselines()
         observables, _, _ = self._discover_observables_from_xml()
         if observables:
@@ -198,6 +298,28 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             self._history = [{"t": 0.0, **self._initial_values}]
             self.publish_outputs(0.0)
 
+    def snapshot(self) -> dict[str, Any]:
+        if self._runner is None:
+            return {}
+        state_ids = self._list_model_ids(_STATE_ID_GETTERS)
+        return {
+            "time": self._time,
+            "history": [dict(row) for row in self._history],
+            # One batched read of the whole model state; getValues returns it
+            # as a single array instead of one runner lookup per id.
+            "values": self._read_values(state_ids if state_ids is not None else list(self._observables)),
+        }
+
+    def restore(self, snapshot: Mapping[str, Any]) -> None:
+        if not snapshot:
+            return
+        if self._runner is None:
+            self.setup()
+        self._time = float(snapshot.get("time", 0.0))
+        self._history = [dict(row) for row in snapshot.get("history", [])]
+        self._set_runner_values({str(key): float(value) for key, value in snapshot.get("values", {}).items()})
+        self.publish_outputs(self._time)
+
     def inputs(self) -> dict[str, SignalSpec]:
         specs = {}
         if self._EXPOSE_INTEGRATION_STEP_INPUT:
@@ -283,6 +405,28 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             specs[name] = SignalSpec.scalar(**kwargs)
         return specs
 
+    def _bound_output_specs(self) -> dict[str, SignalSpec]:
+        """Return ``outputs()`` built once per observable and aux-schema layout.
+
+        Every window binds the same specs to its signals, so they are rebuilt
+        only when the observables or the visualisation aux schema change.
+        Subclasses that override ``outputs()`` are always asked directly.
+        """
+
+        if type(self).outputs is not TelluriumSBMLBioModule.outputs:
+            return self.outputs()
+        aux_schema = self.visualisation_aux_schema()
+        key = (
+            tuple(self._observables),
+            tuple(aux_schema.items()) if aux_schema is not None else None,
+            self.visualisation_aux_description() if aux_schema is not None else None,
+        )
+        cache = self._output_specs_cache
+        if cache is None or cache[0] != key:
+            cache = (key, self.outputs())
+            self._output_specs_cache = cache
+        return cache[1]
+
     def set_inputs(self, inputs: dict[str, BioSignal]) -> None:
         self._input_overrides = dict(inputs or {})
         self.apply_overrides(reset_initial_state=False)
@@ -297,6 +441,39 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             self.set_inputs(inputs)
         else:
             self.apply_overrides(reset_initial_state=False)
+        self._advance_to(end)
+
+    def simulate_timecourse(self, end: float, points: int) -> dict[str, list[float]]:
+        """Advance to ``end`` with a single simulator call and return sampled columns.
+
+        The grid holds ``points`` evenly spaced times from the current time to
+        ``end``, both included, and the result has one sample per grid time.
+        This matches stepping ``advance_window`` across the grid, but crosses
+        into libRoadRunner once rather than per sample. The returned mapping
+        holds ``"t"`` plus one column per observable; it is empty when ``end``
+        is not ahead of the current time.
+        """
+
+        self.apply_overrides(reset_initial_state=False)
+        start = self._time
+        start_row = self._history[-1] if self._history else None
+        rows = self._advance_to(end, n_steps=max(2, int(points)))
+        if rows and start_row is not None and abs(start_row["t"] - start) < 1e-12 and rows[0]["t"] - start > 1e-12:
+            # The shared advance step does not re-record the start sample that
+            # history already holds; it still belongs to the returned grid.
+            rows = [start_row, *rows]
+        columns: dict[str, list[float]] = {"t": [], **{name: [] for name in self._observables}}
+        for row in rows:
+            for name, column in columns.items():
+                column.append(row.get(name, 0.0))
+        return columns
+
+    def _advance_to(self, end: float, n_steps: Optional[int] = None) -> list[dict[str, float]]:
+        """Simulate from the current time to ``end``, record history and publish.
+
+        Shared by ``advance_window`` and ``simulate_timecourse``; returns the
+        simulated rows (empty when ``end`` is not ahead of the current time).
+        """
 
         if self._runner is None:
             self.setup()
@@ -304,15 +481,15 @@ class TelluriumSBMLBioModule(StatefulBioModule):
 
         target = float(end)
         if target <= self._time:
-            return
-
-        rows = self._simulate_window(self._time, target)
+            return []
+        rows = self._simulate_window(self._time, target, n_steps=n_steps)
         if rows:
             self._history.extend(rows)
             self._time = float(rows[-1]["t"])
         else:
             self._time = target
         self.publish_outputs(self._time)
+        return rows
 
     def publish_outputs(self, t: float, payloads: Mapping[str, Any] | None = None) -> None:
         if not self._history:
@@ -320,7 +497,7 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             return
         latest = self._history[-1]
         source = self.source_name()
-        specs = self.outputs()
+        specs = self._bound_output_specs()
         state_output_name = self._STATE_OUTPUT_NAME
         summary_output_name = self._SUMMARY_OUTPUT_NAME
         trajectory_output_name = self._TRAJECTORY_OUTPUT_NAME
@@ -391,6 +568,10 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                 self.integration_step = number
         if self._runner is None:
             return
+        # Collect every write first so the runner sees at most two batched
+        # setValues calls: named parameters/initials, whose result feeds the
+        # initial observable read, then multipliers and free-form overrides.
+        assignments: dict[str, float] = {}
         for input_name, (sbml_id, _default, _units, _description) in self._PARAMETER_INPUTS.items():
             signal = self._input_overrides.get(input_name)
             if signal is None:
@@ -398,12 +579,9 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             number = coerce_float(unwrap_payload(signal), keys=("value", "payload"))
             if number is None:
                 continue
-            try:
-                self._runner[sbml_id] = float(number)
-            except (KeyError, ValueError, TypeError, RuntimeError):
-                pass
+            assignments[sbml_id] = float(number)
         apply_named_initials = reset_initial_state or float(getattr(self, "_time", 0.0)) <= 0.0
-        named_initial_applied = False
+        named_initial_ids: set[str] = set()
         if apply_named_initials:
             for input_name, (sbml_id, _default, _units, _description) in self._INITIAL_CONDITION_INPUTS.items():
                 signal = self._input_overrides.get(input_name)
@@ -412,15 +590,15 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                 number = coerce_float(unwrap_payload(signal), keys=("value", "payload"))
                 if number is None:
                     continue
-                try:
-                    self._runner[sbml_id] = float(number)
-                    named_initial_applied = True
-                except (KeyError, ValueError, TypeError, RuntimeError):
-                    pass
+                assignments[sbml_id] = float(number)
+                named_initial_ids.add(sbml_id)
+        applied = self._set_runner_values(assignments)
+        named_initial_applied = bool(named_initial_ids & applied)
         if named_initial_applied and float(getattr(self, "_time", 0.0)) <= 0.0:
             self._initial_values = self._read_observables()
             if self._history:
                 self._history = [{"t": 0.0, **self._initial_values}]
+        assignments = {}
         for input_name, (sbml_ids, _default, _units, _description) in self._MULTIPLIER_INPUTS.items():
             signal = self._input_overrides.get(input_name)
             if signal is None:
@@ -432,34 +610,61 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                 base = self._param_baselines.get(sbml_id)
                 if base is None:
                     continue
-                try:
-                    self._runner[sbml_id] = float(base) * float(number)
-                except (KeyError, ValueError, TypeError, RuntimeError):
-                    pass
+                assignments[sbml_id] = float(base) * float(number)
+        mapping_inputs = []
         if self._ENABLE_PARAMETER_OVERRIDES:
-            signal = self._input_overrides.get("parameter_overrides")
-            value = unwrap_payload(signal) if signal is not None else None
-            if isinstance(value, Mapping):
-                for sbml_id, raw in value.items():
-                    number = coerce_float(raw, keys=("value", "payload"))
-                    if number is None:
-                        continue
-                    try:
-                        self._runner[str(sbml_id)] = float(number)
-                    except (KeyError, ValueError, TypeError, RuntimeError):
-                        pass
+            mapping_inputs.append("parameter_overrides")
         if self._ENABLE_INITIAL_CONDITIONS:
-            signal = self._input_overrides.get("initial_conditions")
+            mapping_inputs.append("initial_conditions")
+        for input_name in mapping_inputs:
+            signal = self._input_overrides.get(input_name)
             value = unwrap_payload(signal) if signal is not None else None
             if isinstance(value, Mapping):
                 for sbml_id, raw in value.items():
                     number = coerce_float(raw, keys=("value", "payload"))
                     if number is None:
                         continue
-                    try:
-                        self._runner[str(sbml_id)] = float(number)
-                    except (KeyError, ValueError, TypeError, RuntimeError):
-                        pass
+                    assignments[str(sbml_id)] = float(number)
+        self._set_runner_values(assignments)
+
+    def _set_runner_values(self, assignments: Mapping[str, float]) -> set[str]:
+        """Write ``assignments`` into the runner and return the ids that were applied.
+
+        RoadRunner's ``setValues`` takes every id in one call. When the model
+        lists its state ids, only those go into the batch; everything else
+        (selectors such as ``init(S1)``, ids the listing misses) and any batch
+        the runner rejects fall back to per-id item writes. Ids the runner
+        refuses are reported once.
+        """
+
+        writable = self._writable_ids
+        batch = {
+            sbml_id: number for sbml_id, number in assignments.items() if writable is None or sbml_id in writable
+        }
+        pending = dict(assignments)
+        applied: set[str] = set()
+        set_values = getattr(self._runner, "setValues", None)
+        if batch and callable(set_values):
+            try:
+                set_values(list(batch), list(batch.values()))
+            except (KeyError, ValueError, TypeError, RuntimeError):
+                pass
+            else:
+                applied.update(batch)
+                pending = {sbml_id: number for sbml_id, number in pending.items() if sbml_id not in batch}
+        rejected: list[str] = []
+        for sbml_id, number in pending.items():
+            try:
+                self._runner[sbml_id] = number
+            except (KeyError, ValueError, TypeError, RuntimeError):
+                rejected.append(sbml_id)
+                continue
+            applied.add(sbml_id)
+        new_ids = sorted(set(rejected) - self._ignored_override_ids)
+        if new_ids:
+            self._ignored_override_ids.update(new_ids)
+            logger.warning("%s ignoring overrides for unknown SBML ids: %s", self.source_name(), ", ".join(new_ids))
+        return applied
 
     def _capture_multiplier_baselines(self) -> None:
         self._param_baselines = {}
@@ -473,11 +678,15 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                     pass
 
     def _discover_observables_from_xml(self) -> tuple[list[str], dict[str, Optional[str]], dict[str, str]]:
-        try:
-            tree = ET.parse(self._model_path)
-        except (ET.ParseError, OSError):
+        if self._sbml_text is not None:
+            try:
+                root = ET.fromstring(self._sbml_text)
+            except ET.ParseError:
+                return [], {}, {}
+        else:
+            root = _load_sbml_root(self._model_path)
+        if root is None:
             return [], {}, {}
-        root = tree.getroot()
         ns = root.tag.split("}")[0].strip("{") if "}" in root.tag else None
         if not ns:
             return [], {}, {}
@@ -530,14 +739,50 @@ class TelluriumSBMLBioModule(StatefulBioModule):
                                 display[variable] = param_names[variable]
         return observables, units, display
 
+    def _collect_model_ids(self) -> Optional[frozenset[str]]:
+        """Return every id the loaded model can read or write, if the runner lists them."""
+
+        ids = self._list_model_ids((*_STATE_ID_GETTERS, "getReactionIds"))
+        return frozenset(ids) if ids is not None else None
+
+    def _list_model_ids(self, getters: tuple[str, ...]) -> Optional[list[str]]:
+        ids: list[str] = []
+        listed = False
+        for getter in getters:
+            method = getattr(self._runner, getter, None)
+            if not callable(method):
+                continue
+            try:
+                ids.extend(str(sbml_id) for sbml_id in method())
+            except (ValueError, TypeError, RuntimeError):
+                continue
+            listed = True
+        return ids if listed else None
+
     def _read_observables(self) -> dict[str, float]:
+        return self._read_values(self._observables)
+
+    def _read_values(self, names: list[str]) -> dict[str, float]:
+        known = self._model_ids
         values: dict[str, float] = {}
-        for name in self._observables:
+        get_values = getattr(self._runner, "getValues", None)
+        # One RoadRunner call for every listed id. Names outside the model's
+        # id set (selectors such as "[S1]" or "init(S1)") and any batch the
+        # runner rejects are read one at a time below.
+        batch = [name for name in names if known is None or name in known]
+        if callable(get_values) and batch:
+            try:
+                values = {name: float(value) for name, value in zip(batch, get_values(batch))}
+            except (KeyError, ValueError, TypeError, RuntimeError):
+                values = {}
+        for name in names:
+            if name in values:
+                continue
             try:
                 values[name] = float(self._runner[name])
             except (KeyError, ValueError, TypeError, RuntimeError):
                 values[name] = 0.0
-        return values
+        return {name: values[name] for name in names}
 
     def _public_observable_name(self, raw_name: str) -> str:
         return str(self._STATE_OUTPUT_ALIASES.get(raw_name, raw_name))
@@ -596,25 +841,34 @@ class TelluriumSBMLBioModule(StatefulBioModule):
     def _extra_selections(self) -> list[str]:
         return [item for item in self.visualisation_extra_selections() if item not in self._observables]
 
-    def _simulate_window(self, start: float, end: float) -> list[dict[str, float]]:
+    def _simulate_window(self, start: float, end: float, n_steps: Optional[int] = None) -> list[dict[str, float]]:
         if not self._observables:
             return []
-        n_steps = max(2, int(math.ceil((end - start) / self.integration_step)) + 1)
         extra_selections = self._extra_selections()
+        if n_steps is None:
+            n_steps = max(2, int(math.ceil((end - start) / self.integration_step)) + 1)
+            if n_steps == 2 and not extra_selections and callable(getattr(self._runner, "oneStep", None)):
+                # A window no longer than one output step only contributes its
+                # end point, so integrate straight there and read the state
+                # instead of having simulate() sample and allocate a matrix.
+                t = float(self._runner.oneStep(start, end - start))
+                return [{"t": t, **self._read_observables()}]
         selections = ["time", *self._observables, *extra_selections]
         result = self._runner.simulate(start, end, n_steps, selections=selections)
+        names = selections[1:]
+        # Convert the whole result matrix in one call rather than indexing
+        # every (row, column) cell through the ndarray scalar machinery.
+        table = result.tolist() if hasattr(result, "tolist") else [list(row) for row in result]
+        previous_t = self._history[-1]["t"] if self._history else None
         rows: list[dict[str, float]] = []
-        for i in range(result.shape[0]):
-            t = float(result[i, 0])
+        for i, values in enumerate(table):
+            t = float(values[0])
             if rows and abs(t - rows[-1]["t"]) < 1e-12:
                 continue
-            if self._history and i == 0 and abs(t - self._history[-1]["t"]) < 1e-12:
+            if i == 0 and previous_t is not None and abs(t - previous_t) < 1e-12:
                 continue
             row = {"t": t}
-            for j, name in enumerate(self._observables, start=1):
-                row[name] = float(result[i, j])
-            for k, extra_name in enumerate(extra_selections, start=1 + len(self._observables)):
-                row[extra_name] = float(result[i, k])
+            row.update(zip(names, map(float, values[1:])))
             rows.append(row)
         return rows
 
@@ -632,7 +886,7 @@ class TelluriumSBMLBioModule(StatefulBioModule):
         last = self._history[-1]
         changes = {name: abs(last.get(name, 0.0) - first.get(name, 0.0)) for name in self._observables}
         biggest_change = max(changes, key=changes.get)
-        peaks = {name: max(point.get(name, 0.0) for point in self._history) for name in self._observables}
+        peaks = self._history_peaks()
         biggest_peak = max(peaks, key=peaks.get)
         return {
             "duration_simulated": float(t),
@@ -643,13 +897,46 @@ class TelluriumSBMLBioModule(StatefulBioModule):
             "peak_value": float(peaks[biggest_peak]),
         }
 
+    def _history_peaks(self) -> dict[str, float]:
+        """Return the per-observable maximum over the retained history.
+
+        Peaks are folded forward from the rows seen on the previous call, so a
+        window only scans its newly appended rows. Any reset, trim, or change
+        of observables falls back to a full rescan.
+        """
+        history = self._history
+        observables = tuple(self._observables)
+        cache = self._peak_cache
+        if (
+            cache is not None
+            and cache[0] is history
+            and cache[1] is history[0]
+            and cache[2] == observables
+            and cache[3] <= len(history)
+        ):
+            start, peaks = cache[3], cache[4]
+        else:
+            start, peaks = 0, {}
+        for index in range(start, len(history)):
+            row = history[index]
+            for name in observables:
+                value = row.get(name, 0.0)
+                if name not in peaks or value > peaks[name]:
+                    peaks[name] = value
+        self._peak_cache = (history, history[0], observables, len(history), peaks)
+        return dict(peaks)
+
     def _headline_value(self, source_id: str, latest: Mapping[str, float], t: float) -> float:
         window_start = float(t) - self._HEADLINE_WINDOW_S
-        window_values = [
-            row[source_id]
-            for row in self._history
-            if source_id in row and float(row.get("t", 0.0)) >= window_start
-        ]
+        # History rows are appended in time order, so walk back from the end
+        # and stop at the window edge instead of rescanning the whole run.
+        window_values = []
+        for row in reversed(self._history):
+            if float(row.get("t", 0.0)) < window_start:
+                break
+            if source_id in row:
+                window_values.append(row[source_id])
+        window_values.reverse()
         if window_values:
             return sum(window_values) / len(window_values)
         if self._runner is not None:
@@ -13,6 +13,7 @@ import tempfile
 from pathlib import Path
 from typing import Any, Mapping
 
+from ._yaml import safe_yaml_load
 from .pack import (
     PackageError,
     _install_declared_dependencies,
@@ -111,7 +112,7 @@ def _lock_entries(lab_dir: Path) -> dict[tuple[str, str], str]:
         import yaml  # type: ignore
     except ImportError as exc:  # pragma: no cover - package dependency guard
         raise PackageError("Hub composition requires PyYAML") from exc
-    value = yaml.safe_load(lock_path.read_text(encoding="utf-8")) or {}
+    value = safe_yaml_load(yaml, lock_path.read_text(encoding="utf-8")) or {}
     if not isinstance(value, Mapping) or value.get("lock_version") != 1:
         raise PackageError(f"{lock_path} must declare lock_version: 1")
     dependencies = value.get("dependencies")
@@ -1434,7 +1434,7 @@ class LabServeSession:
                 world = prepared.world
 
                 def listener(event: WorldEvent, payload: dict[str, Any]) -> None:
-                    if event == WorldEvent.STEP:
+                    if event is WorldEvent.STEP:
                         now = time.time()
                         pct = float(payload.get("progress_pct") or 0.0)
                         progress = {
@@ -1465,7 +1465,7 @@ class LabServeSession:
                                 self._persist_run_locked(run)
                         return
                     with self._lock:
-                        if event == WorldEvent.STARTED:
+                        if event is WorldEvent.STARTED:
                             run.progress = {
                                 "t": payload.get("t"),
                                 "start": payload.get("start"),
@@ -1476,9 +1476,9 @@ class LabServeSession:
                                 "progress_pct": payload.get("progress_pct"),
                             }
                         message = event.value
-                        if event == WorldEvent.STARTED:
+                        if event is WorldEvent.STARTED:
                             message = "simulation window started"
-                        elif event == WorldEvent.FINISHED:
+                        elif event is WorldEvent.FINISHED:
                             message = "simulation window complete"
                         self._append_run_log_locked(run, "info", message, source="world")
                         self._persist_run_locked(run)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import math
 from typing import Any, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 from .signals import BioSignal, SignalSpec, make_signal
@@ -216,14 +217,33 @@ class StatefulBioModule(SignalEmitterBioModule):
                 self.publish_outputs(self._time)
             return self.get_outputs()
 
-        current = self._time
-        while current < target - 1e-12:
-            h = min(self.integration_step, target - current)
-            self.step(h)
-            current += h
+        # Derive every step boundary from the window start instead of
+        # accumulating ``current += h``, which drifts over long windows.
+        start_time = self._time
+        step_size = self.integration_step
+        n_steps = math.ceil((target - start_time - 1e-12) / step_size)
+        cls = type(self)
+        records_state = cls.record_state is not StatefulBioModule.record_state
+        if n_steps > 0 and not records_state and cls.step is StatefulBioModule.step:
+            # Neither hook does any work, so only the clock moves.
+            self._time = target
+            n_steps = 0
+        # Deleting the head of a full list every step shifts the whole history
+        # each time, so let it grow to twice the cap before trimming. Memory
+        # stays bounded however long the window is, at amortized O(1) per step.
+        trim_at = 2 * self.max_history_points
+        current = start_time
+        for index in range(1, n_steps + 1):
+            next_time = target if index == n_steps else start_time + index * step_size
+            self.step(next_time - current)
+            current = next_time
             self._time = current
-            self.record_state(current)
-            self.trim_history()
+            if records_state:
+                self.record_state(current)
+                history = getattr(self, "_history", None)
+                if isinstance(history, list) and len(history) > trim_at:
+                    self.trim_history()
+        self.trim_history()
 
         self.publish_outputs(self._time)
         return self.get_outputs()
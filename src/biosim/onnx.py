@@ -5,15 +5,33 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
+import logging
+import os
 from pathlib import Path
+import tempfile
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from .modules import BioModule
 from .signals import ArraySignal, RecordSignal, ScalarSignal, SignalSpec
 
+logger = logging.getLogger(__name__)
+
 
 def _flatten_numeric_items(value: Any) -> List[float]:
+    dtype = getattr(value, "dtype", None)
+    if getattr(dtype, "kind", None) in ("b", "i", "u", "f") and hasattr(value, "ndim"):
+        # Numeric tensors (the usual session output): take the leading row in
+        # C and convert once instead of walking nested Python lists.
+        while value.ndim > 1:
+            if value.shape[0] == 0:
+                return []
+            value = value[0]
+        if not value.ndim:
+            return [float(value)]
+        # Float tensors already convert to Python floats; only cast the rest.
+        return (value if dtype.kind == "f" else value.astype(float)).tolist()
     if hasattr(value, "tolist"):
         value = value.tolist()
     while isinstance(value, list) and value and isinstance(value[0], list):
@@ -27,6 +45,31 @@ def _flatten_numeric_items(value: Any) -> List[float]:
     return []
 
 
+@functools.lru_cache(maxsize=8)
+def _load_session(
+    model_path: str,
+    mtime_ns: int,
+    providers: tuple[str, ...],
+    intra_op_num_threads: Optional[int],
+) -> Any:
+    """Load one shared InferenceSession per model revision and settings.
+
+    Sessions are safe to run concurrently, so modules wrapping the same model
+    (ensembles, branched worlds) reuse a single optimized graph instead of
+    loading it again.
+    """
+    ort = importlib.import_module("onnxruntime")
+    # Batch-1 classification is dominated by per-call overhead: fuse the
+    # graph fully at load time and avoid waking a thread pool per window.
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    if intra_op_num_threads is not None:
+        options.intra_op_num_threads = int(intra_op_num_threads)
+        options.inter_op_num_threads = 1
+    return ort.InferenceSession(model_path, sess_options=options, providers=list(providers))
+
+
 class OnnxClassifierModule(BioModule):
     """Run an ONNX classifier behind the standard BioModule contract."""
 
@@ -45,9 +88,13 @@ class OnnxClassifierModule(BioModule):
         integration_step: float = 0.001,
         session_factory: Optional[Callable[[str], Any]] = None,
         providers: Optional[Sequence[str]] = None,
+        intra_op_num_threads: Optional[int] = 1,
+        quantize: Optional[str] = None,
         probabilities_description: str = "Classifier probabilities over the declared ONNX class labels",
         predicted_description: str = "Most likely ONNX-predicted state",
     ) -> None:
+        if quantize not in (None, "int8"):
+            raise ValueError(f"Unsupported ONNX quantization mode: {quantize!r}")
         self.integration_step = float(integration_step)
         self.model_path = model_path
         self.class_labels = list(class_labels or ["class_0"])
@@ -60,13 +107,25 @@ class OnnxClassifierModule(BioModule):
         self.input_vector_length = input_vector_length
         self._session_factory = session_factory
         self.providers = list(providers or ["CPUExecutionProvider"])
+        self.intra_op_num_threads = intra_op_num_threads
+        self.quantize = quantize
         self.probabilities_description = probabilities_description
         self.predicted_description = predicted_description
         self._session: Any = None
+        self._io_binding: Any = None
+        self._input_bindable: bool = False
+        self._input_bind_width: Optional[int] = None
+        self._input_buffer: Any = None
+        self._input_ortvalue: Any = None
+        self._output_buffer: Any = None
+        self._output_names: List[str] = []
+        self._feed: Dict[str, Any] = {}
+        self._output_specs_cache: Optional[tuple[tuple[Any, ...], Mapping[str, SignalSpec]]] = None
         self._latest_vector: List[float] = self._initial_vector()
         self._latest_probs: List[float] = [1.0] + [0.0] * (len(self.class_labels) - 1)
         self._latest_label: str = self.class_labels[0]
         self._outputs: Dict[str, Any] = {}
+        self._visual: Optional[Dict[str, Any]] = None
 
     def inputs(self) -> Mapping[str, SignalSpec]:
         vector_length = self.input_vector_length or len(self.class_labels)
@@ -93,11 +152,35 @@ class OnnxClassifierModule(BioModule):
             ),
         }
 
+    def _bound_output_specs(self) -> Mapping[str, SignalSpec]:
+        """Return ``outputs()`` built once per port/label configuration.
+
+        Each window binds the same specs to its output signals, so they are
+        not rebuilt and re-validated unless a port name, label, or
+        description changes. Subclasses that override ``outputs()`` are
+        always asked directly.
+        """
+        if type(self).outputs is not OnnxClassifierModule.outputs:
+            return self.outputs()
+        key = (
+            self.probabilities_port,
+            self.predicted_port,
+            tuple(self.class_labels),
+            self.probabilities_description,
+            self.predicted_description,
+        )
+        cache = self._output_specs_cache
+        if cache is None or cache[0] != key:
+            cache = (key, self.outputs())
+            self._output_specs_cache = cache
+        return cache[1]
+
     def reset(self) -> None:
         self._latest_vector = self._initial_vector()
         self._latest_probs = [1.0] + [0.0] * (len(self.class_labels) - 1)
         self._latest_label = self.class_labels[0]
         self._outputs = {}
+        self._visual = None
 
     def _initial_vector(self) -> List[float]:
         if self.input_vector_length is None:
@@ -112,20 +195,73 @@ class OnnxClassifierModule(BioModule):
             return str((self.base_dir / path).resolve())
         return str(path.resolve())
 
+    def _quantized_model_path(self, model_path: str) -> str:
+        """Return an INT8 dynamically quantized copy of ``model_path``.
+
+        The copy is written next to the source model and regenerated only when
+        the source is newer, so quantization runs once per model revision. It
+        is quantized into a temporary file and moved into place atomically, so
+        concurrent loaders never read a half-written model; if the copy cannot
+        be written (e.g. a read-only model directory) the fp32 model is used.
+        """
+        source = Path(model_path)
+        target = source.with_suffix(".int8.onnx")
+        if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            return str(target)
+        quantization = importlib.import_module("onnxruntime.quantization")
+        tmp_path: Optional[str] = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{target.stem}.", suffix=".onnx", dir=target.parent)
+            os.close(fd)
+            quantization.quantize_dynamic(
+                str(source),
+                tmp_path,
+                weight_type=quantization.QuantType.QInt8,
+                per_channel=True,
+                reduce_range=False,
+            )
+            os.replace(tmp_path, target)
+            tmp_path = None
+        except Exception:  # noqa: BLE001 - any failure leaves the fp32 model usable
+            logger.warning("could not write INT8 model for %s; using the fp32 model", source, exc_info=True)
+            return str(source)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        return str(target)
+
     def _default_session_factory(self) -> Callable[[str], Any]:
-        ort = importlib.import_module("onnxruntime")
-        return lambda model_path: ort.InferenceSession(model_path, providers=self.providers)
+        providers = tuple(self.providers)
+
+        def factory(model_path: str) -> Any:
+            try:
+                mtime_ns = Path(model_path).stat().st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            return _load_session(model_path, mtime_ns, providers, self.intra_op_num_threads)
+
+        return factory
 
     def _ensure_session(self) -> Any:
         if self._session is None:
             factory = self._session_factory or self._default_session_factory()
-            self._session = factory(self._resolved_model_path())
+            model_path = self._resolved_model_path()
+            if self.quantize == "int8":
+                model_path = self._quantized_model_path(model_path)
+            self._session = factory(model_path)
             inputs = getattr(self._session, "get_inputs", lambda: [])()
             outputs = getattr(self._session, "get_outputs", lambda: [])()
             if inputs:
                 self._input_name = str(inputs[0].name)
+            self._input_bindable, self._input_bind_width = self._bindable_input(inputs[0] if inputs else None)
             if outputs:
                 self._output_name = str(outputs[0].name)
+            # Bind the run() arguments once; each window only swaps the row.
+            self._output_names = [self._output_name]
+            self._feed = {self._input_name: None}
         return self._session
 
     def _normalize_input_value(self, raw: Any) -> List[float]:
@@ -133,9 +269,9 @@ class OnnxClassifierModule(BioModule):
             raw = raw.get("features", raw)
         vector = _flatten_numeric_items(raw)
         if self.input_vector_length is not None:
-            vector = vector[: self.input_vector_length]
-            while len(vector) < self.input_vector_length:
-                vector.append(0.0)
+            length = self.input_vector_length
+            vector = vector[:length]
+            vector.extend([0.0] * (length - len(vector)))
         return vector
 
     def set_inputs(self, signals: Dict[str, Any]) -> None:
@@ -144,23 +280,139 @@ class OnnxClassifierModule(BioModule):
             return
         self._latest_vector = self._normalize_input_value(signal.value)
 
+    @staticmethod
+    def _bindable_input(meta: Any) -> tuple[bool, Optional[int]]:
+        """Return whether the model input fits the bound ``(1, n)`` float32 buffer.
+
+        The second item is the declared feature count, or None when symbolic.
+        Other input types (double, int64), other ranks, and fixed batch sizes
+        other than one keep going through ``session.run``'s conversion.
+        """
+        if meta is None or getattr(meta, "type", None) != "tensor(float)":
+            return False, None
+        shape = getattr(meta, "shape", None)
+        if not isinstance(shape, (list, tuple)) or len(shape) != 2:
+            return False, None
+        batch, width = shape
+        if isinstance(batch, int) and batch != 1:
+            return False, None
+        if isinstance(width, int):
+            return width > 0, width
+        return True, None
+
+    def _run_bound_inference(self, session: Any) -> List[Any]:
+        """Run through an IOBinding over persistent float32 buffers.
+
+        The binding is rebuilt only when the input vector length changes, so
+        steady-state windows copy the features into the same buffer and skip
+        building a feed dict. When onnxruntime exposes ``OrtValue`` the buffer
+        is wrapped once and bound as that handle; it shares the numpy memory,
+        so later writes to the buffer need no conversion. A float output with
+        a static shape is bound the same way and read back without a copy.
+        """
+        import numpy as np
+
+        vector = self._latest_vector
+        buffer = self._input_buffer
+        if self._io_binding is None or buffer is None or buffer.shape[1] != len(vector):
+            buffer = np.zeros((1, len(vector)), dtype=np.float32)
+            binding = session.io_binding()
+            try:
+                from onnxruntime import OrtValue
+            except ImportError:
+                OrtValue = None
+            if OrtValue is not None and hasattr(binding, "bind_ortvalue_input"):
+                self._input_ortvalue = OrtValue.ortvalue_from_numpy(buffer)
+                binding.bind_ortvalue_input(self._input_name, self._input_ortvalue)
+            else:
+                self._input_ortvalue = None
+                binding.bind_input(self._input_name, "cpu", 0, np.float32, buffer.shape, buffer.ctypes.data)
+            output_shape = self._static_output_shape(session)
+            if OrtValue is not None and output_shape is not None and hasattr(binding, "bind_ortvalue_output"):
+                self._output_buffer = np.zeros(output_shape, dtype=np.float32)
+                binding.bind_ortvalue_output(self._output_name, OrtValue.ortvalue_from_numpy(self._output_buffer))
+            else:
+                self._output_buffer = None
+                binding.bind_output(self._output_name, "cpu")
+            self._input_buffer = buffer
+            self._io_binding = binding
+        buffer[0, :] = vector
+        session.run_with_iobinding(self._io_binding)
+        if self._output_buffer is not None:
+            return [self._output_buffer]
+        return self._io_binding.copy_outputs_to_cpu()
+
+    def _static_output_shape(self, session: Any) -> Optional[tuple[int, ...]]:
+        """Return the bound output's shape for a batch of one, if fully static."""
+        for output in getattr(session, "get_outputs", lambda: [])():
+            if str(output.name) != self._output_name:
+                continue
+            if getattr(output, "type", None) != "tensor(float)":
+                return None
+            shape = list(getattr(output, "shape", None) or [])
+            if not shape:
+                return None
+            if not isinstance(shape[0], int):
+                shape[0] = 1
+            if not all(isinstance(dim, int) and dim > 0 for dim in shape):
+                return None
+            return tuple(shape)
+        return None
+
     def _run_inference(self) -> List[float]:
         session = self._ensure_session()
-        vector: List[Iterable[float]] = [self._latest_vector]
-        result = session.run([self._output_name], {self._input_name: vector})
+        width = self._input_bind_width
+        if (
+            self._input_bindable
+            and (width is None or width == len(self._latest_vector))
+            and hasattr(session, "io_binding")
+            and hasattr(session, "run_with_iobinding")
+        ):
+            result = self._run_bound_inference(session)
+        else:
+            vector: List[Iterable[float]] = [self._latest_vector]
+            self._feed[self._input_name] = vector
+            result = session.run(self._output_names, self._feed)
         if not result:
             return [1.0] + [0.0] * (len(self.class_labels) - 1)
         probs = _flatten_numeric_items(result[0])
         return probs or ([1.0] + [0.0] * (len(self.class_labels) - 1))
 
+    def _fit_probabilities(self, probs: List[float]) -> List[float]:
+        label_count = len(self.class_labels)
+        if not probs:
+            return [1.0] + [0.0] * (label_count - 1)
+        probs = probs[:label_count]
+        probs.extend([0.0] * (label_count - len(probs)))
+        return probs
+
+    def predict_batch(self, vectors: Sequence[Any]) -> List[List[float]]:
+        """Classify several feature vectors with a single session call.
+
+        Stacking rows into one ``(N, features)`` input amortizes the per-call
+        overhead that dominates batch-1 inference. Module state and published
+        outputs are left untouched.
+        """
+        rows = [self._normalize_input_value(vector) for vector in vectors]
+        if not rows:
+            return []
+        session = self._ensure_session()
+        result = session.run([self._output_name], {self._input_name: rows})
+        batch = result[0] if result else []
+        if hasattr(batch, "tolist"):
+            batch = batch.tolist()
+        return [
+            self._fit_probabilities(_flatten_numeric_items(batch[index]) if index < len(batch) else [])
+            for index in range(len(rows))
+        ]
+
     def advance_window(self, start: float, end: float) -> None:
-        probs = self._run_inference()
-        if len(probs) < len(self.class_labels):
-            probs = probs + [0.0] * (len(self.class_labels) - len(probs))
-        self._latest_probs = probs[: len(self.class_labels)]
+        probs = self._fit_probabilities(self._run_inference())
+        self._latest_probs = probs
         max_idx = max(range(len(self._latest_probs)), key=self._latest_probs.__getitem__)
         self._latest_label = self.class_labels[max_idx]
-        specs = self.outputs()
+        self._visual = None
+        specs = self._bound_output_specs()
 
         source = getattr(self, "_world_name", self.__class__.__name__)
         self._outputs = {
@@ -204,11 +456,16 @@ class OnnxClassifierModule(BioModule):
             self._latest_vector = self._initial_vector()
         self._latest_probs = list(snapshot.get("latest_probs", self._latest_probs))
         self._latest_label = str(snapshot.get("latest_label", self._latest_label))
+        self._visual = None
 
     def visualize(self) -> Optional[Dict[str, Any]]:
         if not self._outputs:
             return None
-        return {
+        # UIs poll visuals far more often than windows advance; rebuild the
+        # payload only after a new classification.
+        if self._visual is not None:
+            return self._visual
+        self._visual = {
             "render": "bar",
             "data": {
                 "items": [
@@ -218,8 +475,13 @@ class OnnxClassifierModule(BioModule):
             },
             "description": f"Latest ONNX classification result: {self._latest_label}.",
         }
+        return self._visual
 
     def __getstate__(self) -> Dict[str, Any]:
         state = dict(self.__dict__)
         state["_session"] = None
+        state["_io_binding"] = None
+        state["_input_buffer"] = None
+        state["_input_ortvalue"] = None
+        state["_output_buffer"] = None
         return state
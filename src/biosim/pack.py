@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Callable, Iterable, Mapping
 from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
+from ._yaml import safe_yaml_load
 from .modules import BioModule
 from .runtime import (
     LabTree,
@@ -124,7 +125,7 @@ def _safe_yaml_dump(value: Any) -> bytes:
 
 def _safe_yaml_load(data: bytes | str) -> dict[str, Any]:
     yaml = _require_yaml()
-    loaded = yaml.safe_load(data) or {}
+    loaded = safe_yaml_load(yaml, data) or {}
     if not isinstance(loaded, dict):
         raise PackageError("YAML document must be a mapping")
     return loaded
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping
 
+from ._yaml import safe_yaml_load
 from .pack import PackageError, build_package, validate_package
 
 
@@ -212,7 +213,7 @@ def _safe_yaml_load(path: Path) -> Any:
         raise ImportError(
             "Package repository support requires PyYAML. Install with: pip install pyyaml"
         ) from exc
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return safe_yaml_load(yaml, path.read_text(encoding="utf-8")) or {}
 
 
 def _optional_str(mapping: Mapping[str, Any], key: str) -> str | None:
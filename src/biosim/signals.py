@@ -16,6 +16,8 @@ except Exception:  # pragma: no cover - optional dependency
     _np = None
 
 _HAS_NUMPY = bool(_np is not None and hasattr(_np, "asarray") and hasattr(_np, "ndarray"))
+# Container types a scalar signal must reject, resolved once at import.
+_NON_SCALAR_TYPES: tuple[type, ...] = (list, tuple, dict) + ((_np.ndarray,) if _HAS_NUMPY else ())
 
 SignalType = Literal["scalar", "array", "record", "event"]
 SignalKind = Literal["state", "event"]
@@ -676,6 +678,10 @@ def scalar_or_record_input(unit: str, description: str, *, dtype: str = "float64
 class BioSignal:
     """Base class for all typed signals."""
 
+    # Signals are created for every output and routed input each window;
+    # slots keep them small and make attribute access a fixed offset.
+    __slots__ = ("source", "name", "value", "emitted_at", "spec")
+
     signal_type: SignalType = "record"
 
     def __init__(
@@ -689,14 +695,21 @@ class BioSignal:
     ) -> None:
         if self.__class__ is BioSignal:
             raise TypeError("BioSignal is an abstract base; construct ScalarSignal, ArraySignal, RecordSignal, or EventSignal")
-        kwargs = {
-            "source": source,
-            "name": name,
-            "value": value,
-            "emitted_at": emitted_at,
-            "spec": spec,
-        }
-        source, name, value, emitted_at, spec, _ = _coerce_init_args(args, kwargs)
+        if args:
+            kwargs = {
+                "source": source,
+                "name": name,
+                "value": value,
+                "emitted_at": emitted_at,
+                "spec": spec,
+            }
+            source, name, value, emitted_at, spec, _ = _coerce_init_args(args, kwargs)
+        else:
+            # Keyword-only construction (every framework call site) needs no
+            # positional merging, so skip building the kwargs dict.
+            if source is None or name is None or emitted_at is None:
+                raise TypeError("signals require source, name, and emitted_at")
+            source, name, emitted_at = str(source), str(name), float(emitted_at)
 
         self.source = source
         self.name = name
@@ -716,32 +729,54 @@ class BioSignal:
             )
         return spec
 
-    @property
-    def kind(self) -> SignalKind:
-        return "event" if self.signal_type == "event" else "state"
+    # Derived from the class-level ``signal_type`` once per class (see
+    # ``__init_subclass__``) so the routing loop reads plain attributes.
+    kind: SignalKind = "state"
+    is_scalar: bool = False
+    is_array: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        derived = {
+            "kind": "event" if cls.signal_type == "event" else "state",
+            "is_scalar": cls.signal_type == "scalar",
+            "is_array": cls.signal_type == "array",
+        }
+        for attr, value in derived.items():
+            if attr not in cls.__dict__:
+                setattr(cls, attr, value)
 
     def with_spec(self, spec: SignalSpec) -> "BioSignal":
         cloned = self._clone(spec=spec)
         return cloned
 
+    def copy(self) -> "BioSignal":
+        # The value already passed validation against the same spec, so copy
+        # the signal instead of rebuilding it; only the value is not shared.
+        cloned = copy.copy(self)
+        cloned.value = self._copy_value()
+        return cloned
+
     def retarget(self, *, name: str) -> "BioSignal":
-        return self._clone(name=name)
+        cloned = self.copy()
+        cloned.name = str(name)
+        return cloned
+
+    def _copy_value(self) -> Any:
+        return copy.deepcopy(self.value)
 
     def _clone(self, *, spec: Optional[SignalSpec] = None, name: Optional[str] = None) -> "BioSignal":
         return self.__class__(
             source=self.source,
             name=name or self.name,
-            value=copy.deepcopy(self.value),
+            value=self._copy_value(),
             emitted_at=self.emitted_at,
             spec=spec or self.spec,
         )
 
     def _validate_value(self) -> None:
         if self.signal_type == "scalar":
-            disallowed = (list, tuple, dict)
-            if _HAS_NUMPY:
-                disallowed = disallowed + (_np.ndarray,)
-            if isinstance(self.value, disallowed):
+            if isinstance(self.value, _NON_SCALAR_TYPES):
                 raise TypeError("scalar signals require a scalar JSON value")
             _ensure_json_serializable(self.value)
             return
@@ -825,14 +860,6 @@ class BioSignal:
             raise ValueError(f"unknown signal type: {signal_type!r}")
         return signal_cls.from_wire_dict(data, spec=spec)
 
-    @property
-    def is_scalar(self) -> bool:
-        return self.signal_type == "scalar"
-
-    @property
-    def is_array(self) -> bool:
-        return self.signal_type == "array"
-
     def as_float(self) -> float:
         if self.signal_type != "scalar":
             raise ValueError(f"signal {self.name!r} is not scalar")
@@ -841,27 +868,31 @@ class BioSignal:
     def as_array(self) -> np.ndarray:
         if self.signal_type != "array":
             raise ValueError(f"signal {self.name!r} is not an array")
-        if _HAS_NUMPY:
-            return _np.asarray(self.value)
-        return self.value
+        value = self.value
+        if _HAS_NUMPY and not isinstance(value, _np.ndarray):
+            return _np.asarray(value)
+        return value
 
 
 class ScalarSignal(BioSignal):
+    __slots__ = ()
+
     signal_type: SignalType = "scalar"
 
     def _validate_value(self) -> None:
-        disallowed = (list, tuple, dict)
-        if _HAS_NUMPY:
-            disallowed = disallowed + (_np.ndarray,)
-        if isinstance(self.value, disallowed):
+        if isinstance(self.value, _NON_SCALAR_TYPES):
             raise TypeError("scalar signals require a scalar JSON value")
         _ensure_json_serializable(self.value)
 
+    def _copy_value(self) -> Any:
+        # Scalar values are immutable JSON scalars, so routing can share them.
+        return self.value
+
     def _clone(self, *, spec: Optional[SignalSpec] = None, name: Optional[str] = None) -> "ScalarSignal":
         return ScalarSignal(
             source=self.source,
             name=name or self.name,
-            value=copy.deepcopy(self.value),
+            value=self._copy_value(),
             emitted_at=self.emitted_at,
             spec=spec or self.spec,
         )
@@ -881,6 +912,8 @@ class ScalarSignal(BioSignal):
 
 
 class ArraySignal(BioSignal):
+    __slots__ = ("_array",)
+
     signal_type: SignalType = "array"
 
     def __init__(
@@ -924,17 +957,26 @@ class ArraySignal(BioSignal):
                 raise ValueError(f"array signal shape {actual_shape} != declared shape {self.spec.shape}")
             if _HAS_NUMPY and isinstance(self.value, _np.ndarray) and self.spec.dtype is not None and actual_dtype != self.spec.dtype:
                 try:
-                    self.value = self.value.astype(self.spec.dtype)
+                    self.value = self.value.astype(self.spec.dtype, copy=False)
+                    self._array = self.value
                 except TypeError as exc:
                     raise ValueError(
                         f"array signal dtype {actual_dtype!s} != declared dtype {self.spec.dtype}"
                     ) from exc
 
+    def copy(self) -> "ArraySignal":
+        cloned = super().copy()
+        cloned._array = cloned.value
+        return cloned
+
+    def _copy_value(self) -> Any:
+        return self.value.copy() if hasattr(self.value, "copy") else copy.deepcopy(self.value)
+
     def _clone(self, *, spec: Optional[SignalSpec] = None, name: Optional[str] = None) -> "ArraySignal":
         return ArraySignal(
             source=self.source,
             name=name or self.name,
-            value=self.value.copy() if hasattr(self.value, "copy") else copy.deepcopy(self.value),
+            value=self._copy_value(),
             emitted_at=self.emitted_at,
             spec=spec or self.spec,
         )
@@ -964,6 +1006,8 @@ class ArraySignal(BioSignal):
 
 
 class RecordSignal(BioSignal):
+    __slots__ = ()
+
     signal_type: SignalType = "record"
 
     def _validate_value(self) -> None:
@@ -982,7 +1026,7 @@ class RecordSignal(BioSignal):
         return RecordSignal(
             source=self.source,
             name=name or self.name,
-            value=copy.deepcopy(self.value),
+            value=self._copy_value(),
             emitted_at=self.emitted_at,
             spec=spec or self.spec,
         )
@@ -1002,6 +1046,8 @@ class RecordSignal(BioSignal):
 
 
 class EventSignal(BioSignal):
+    __slots__ = ()
+
     signal_type: SignalType = "event"
 
     def _validate_value(self) -> None:
@@ -1020,7 +1066,7 @@ class EventSignal(BioSignal):
         return EventSignal(
             source=self.source,
             name=name or self.name,
-            value=copy.deepcopy(self.value),
+            value=self._copy_value(),
             emitted_at=self.emitted_at,
             spec=spec or self.spec,
         )
@@ -3,6 +3,51 @@ from __future__ import annotations
 from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
 import json
 
+# Exact types json.dumps encodes natively (and accepts as dict keys).
+_PLAIN_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_json(data: Any) -> bool:
+    """Return True when ``data`` holds only plain JSON containers and scalars.
+
+    Walking the types is about twice as fast as encoding with ``json.dumps``
+    and gives the same verdict for such data. Anything else (subclasses,
+    enums, UUIDs, sets, shared or cyclic containers) is left to json.
+    """
+    plain_types = _PLAIN_JSON_TYPES
+    seen: set[int] = set()
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        item_type = type(item)
+        if item_type in plain_types:
+            continue
+        if item_type is dict:
+            if id(item) in seen:
+                return False
+            seen.add(id(item))
+            for key in item:
+                if type(key) not in plain_types:
+                    return False
+            extend(item.values())
+        elif item_type is list or item_type is tuple:
+            if id(item) in seen:
+                return False
+            seen.add(id(item))
+            extend(item)
+        else:
+            return False
+    return True
+
+
+def _probe_json_serializable(data: Any) -> None:
+    """Raise ``TypeError`` when ``data`` cannot be encoded by ``json.dumps``."""
+    if _is_plain_json(data):
+        return
+    json.dumps(data)
+
 
 class VisualSpec(TypedDict, total=False):
     """Renderer-agnostic visual specification for browser clients.
@@ -40,13 +85,10 @@ def validate_visual_spec(spec: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         return False, "'data' must be a dict"
     if "description" in spec and not isinstance(spec["description"], str):
         return False, "'description' must be a string"
-    # Check JSON serializability (best-effort)
+    # Check JSON serializability (best-effort). render and description are
+    # already known to be strings, so only the data payload needs encoding.
     try:
-        # Include optional fields that the UI may rely on.
-        payload: Dict[str, Any] = {"render": render, "data": data}
-        if "description" in spec:
-            payload["description"] = spec["description"]
-        json.dumps(payload)
+        _probe_json_serializable(data)
     except TypeError as exc:
         return False, f"data not JSON-serializable: {exc}"
     return True, None
@@ -63,13 +105,15 @@ def normalize_visuals(visuals: Visuals) -> List[VisualSpec]:
     else:
         items = [visuals]  # type: ignore[list-item]
     out: List[VisualSpec] = []
+    append = out.append
     for v in items:
-        ok, _ = validate_visual_spec(v)
-        if ok:
-            normed: Dict[str, Any] = {"render": v["render"], "data": v["data"]}
-            if "description" in v and isinstance(v["description"], str):
-                normed["description"] = v["description"]
-            out.append(normed)  # type: ignore[arg-type]
+        if not validate_visual_spec(v)[0]:
+            continue
+        # validate_visual_spec already rejected non-string descriptions.
+        normed: Dict[str, Any] = {"render": v["render"], "data": v["data"]}
+        if "description" in v:
+            normed["description"] = v["description"]
+        append(normed)  # type: ignore[arg-type]
     return out
 
 
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
+import functools
 from importlib import import_module
 import inspect
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
+from ._yaml import safe_yaml_load
 from .modules import BioModule
 from .signals import SignalSpec, validate_connection_specs, validate_port_spec_direction
 from .world import BioWorld
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_ref(ref: str) -> Tuple[str, str]:
     parts = ref.rsplit(".", 1)
     if len(parts) != 2:
@@ -57,13 +61,24 @@ class WiringBuilder:
         self._pending_connections.append((src_ref, list(dst_refs)))
         return self
 
+    def connect_many(self, edges: Iterable[Tuple[str, Iterable[str]]]) -> "WiringBuilder":
+        """Queue several ``(src_ref, dst_refs)`` edges in one call."""
+        self._pending_connections.extend((src_ref, list(dst_refs)) for src_ref, dst_refs in edges)
+        return self
+
     def apply(self) -> None:
+        # Normalize each module's declared ports once per apply, not once per edge.
+        outputs_by_module: dict[str, dict[str, SignalSpec]] = {}
+        inputs_by_module: dict[str, dict[str, SignalSpec]] = {}
         for src_ref, dst_refs in self._pending_connections:
             src_name, src_port = _parse_ref(src_ref)
             src_mod = self.registry.get(src_name)
             if src_mod is None:
                 raise KeyError(f"connect {src_ref}: unknown module name '{src_name}'")
-            declared_out = _normalize_declared_ports(src_mod.outputs(), direction="output", module_name=src_name)
+            declared_out = outputs_by_module.get(src_name)
+            if declared_out is None:
+                declared_out = _normalize_declared_ports(src_mod.outputs(), direction="output", module_name=src_name)
+                outputs_by_module[src_name] = declared_out
             if src_port not in declared_out:
                 raise ValueError(
                     f"connect {src_ref}: module '{src_name}' has no output port '{src_port}'. "
@@ -74,7 +89,10 @@ class WiringBuilder:
                 dst_mod = self.registry.get(dst_name)
                 if dst_mod is None:
                     raise KeyError(f"connect {src_ref} -> {dst_ref}: unknown module '{dst_name}'")
-                declared_in = _normalize_declared_ports(dst_mod.inputs(), direction="input", module_name=dst_name)
+                declared_in = inputs_by_module.get(dst_name)
+                if declared_in is None:
+                    declared_in = _normalize_declared_ports(dst_mod.inputs(), direction="input", module_name=dst_name)
+                    inputs_by_module[dst_name] = declared_in
                 if dst_port not in declared_in:
                     raise ValueError(
                         f"connect {src_ref} -> {dst_ref}: module '{dst_name}' has no input port '{dst_port}'. "
@@ -85,6 +103,7 @@ class WiringBuilder:
         self._pending_connections.clear()
 
 
+@functools.lru_cache(maxsize=None)
 def _import_from_string(path: str) -> Any:
     mod_name, _, attr = path.rpartition(".")
     if not mod_name or not attr:
@@ -124,6 +143,7 @@ def build_from_spec(world: BioWorld, spec: Mapping[str, Any]) -> WiringBuilder:
 
     wiring_section = spec.get("wiring") if isinstance(spec, Mapping) else None
     if isinstance(wiring_section, list):
+        edges: List[Tuple[str, List[str]]] = []
         for entry in wiring_section:
             if not isinstance(entry, Mapping):
                 raise ValueError("Invalid wiring entry")
@@ -131,7 +151,8 @@ def build_from_spec(world: BioWorld, spec: Mapping[str, Any]) -> WiringBuilder:
             to = entry.get("to")
             if not isinstance(src, str) or not isinstance(to, list):
                 raise ValueError("Wiring entries require 'from' (str) and 'to' (list[str])")
-            builder.connect(src, to)
+            edges.append((src, to))
+        builder.connect_many(edges)
 
     builder.apply()
     return builder
@@ -148,28 +169,59 @@ def load_wiring(world: BioWorld, path: str | Path) -> WiringBuilder:
 
 
 def load_wiring_toml(world: BioWorld, path: str | Path) -> WiringBuilder:
-    p = Path(path)
-    data: Dict[str, Any]
-    try:
-        import tomllib  # type: ignore[attr-defined]
-    except Exception:  # pragma: no cover - fallback for <3.11
-        try:
-            import tomli as tomllib  # type: ignore
-        except Exception as exc:  # pragma: no cover
-            raise ImportError("TOML support requires Python 3.11+ or 'tomli' installed") from exc
-    with p.open("rb") as f:
-        data = tomllib.load(f)
+    data: Dict[str, Any] = _load_wiring_data(Path(path), "toml")
     return build_from_spec(world, data)
 
 
 def load_wiring_yaml(world: BioWorld, path: str | Path) -> WiringBuilder:
-    p = Path(path)
+    data = _load_wiring_data(Path(path), "yaml")
+    if not isinstance(data, Mapping):
+        raise ValueError("YAML wiring must load to a mapping/dict")
+    return build_from_spec(world, data)
+
+
+def _load_wiring_data(path: Path, fmt: str) -> Any:
+    """Parse a wiring file, reusing the parse while the file is unchanged on disk.
+
+    Sweeps load the same spec many times; the cached parse is keyed by the
+    file's mtime and size and copied so callers cannot mutate it.
+    """
+    stat = path.stat()
+    parsed = _parse_wiring_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size, fmt)
+    try:
+        return _copy_parsed(parsed)
+    except RecursionError:
+        # Only self-referencing YAML anchors get here; deepcopy's memo copes.
+        return copy.deepcopy(parsed)
+
+
+def _copy_parsed(value: Any) -> Any:
+    # Parsed YAML/TOML is plain containers over immutable scalars, so copying
+    # the containers is enough and skips deepcopy's per-object memo work.
+    if isinstance(value, dict):
+        return {key: _copy_parsed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_parsed(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_wiring_file(path: str, mtime_ns: int, size: int, fmt: str) -> Any:
+    if fmt == "toml":
+        try:
+            import tomllib  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - fallback for <3.11
+            try:
+                import tomli as tomllib  # type: ignore
+            except Exception as exc:  # pragma: no cover
+                raise ImportError("TOML support requires Python 3.11+ or 'tomli' installed") from exc
+        with open(path, "rb") as f:
+            return tomllib.load(f)
     try:
         import yaml  # type: ignore
     except Exception as exc:  # pragma: no cover
         raise ImportError("YAML support requires 'pyyaml' installed") from exc
-    with p.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not isinstance(data, Mapping):
-        raise ValueError("YAML wiring must load to a mapping/dict")
-    return build_from_spec(world, data)
+    with open(path, "r", encoding="utf-8") as f:
+        return safe_yaml_load(yaml, f)
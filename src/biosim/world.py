@@ -3,9 +3,12 @@ from __future__ import annotations
 import copy
 from dataclasses import dataclass
 from enum import Enum
+import inspect
 import logging
+import sys
 import threading
-from typing import Any, Callable, Dict, List, Mapping, Optional
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from .modules import BioModule
 from .signals import BioSignal, SignalSpec, validate_connection_specs, validate_port_spec_direction
@@ -13,6 +16,11 @@ from .visuals import normalize_visuals
 
 logger = logging.getLogger(__name__)
 
+# Tracebacks logged per failing listener before further failures are muted.
+MAX_LOGGED_LISTENER_FAILURES = 3
+# Likewise for a module whose visualize() keeps raising on every poll.
+MAX_LOGGED_VISUALIZE_FAILURES = 3
+
 
 class WorldEvent(Enum):
     """Runtime events emitted by the BioWorld orchestrator."""
@@ -33,7 +41,7 @@ class SimulationStop(Exception):
     """Internal cooperative stop signal for the run loop."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleEntry:
     name: str
     module: BioModule
@@ -41,7 +49,7 @@ class ModuleEntry:
     output_specs: dict[str, SignalSpec]
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     source_module: str
     source_signal: str
@@ -49,6 +57,21 @@ class Connection:
     target_signal: str
     last_event_time: Optional[float] = None
     last_stale_warning_time: Optional[float] = None
+    target_spec: Optional[SignalSpec] = None
+
+
+@dataclass(slots=True, eq=False)
+class ListenerRegistration:
+    """One ``on()`` call: the callback, its event filter, and failure count."""
+
+    callback: Any
+    events: Optional[frozenset[WorldEvent]] = None
+    weak: bool = False
+    failures: int = 0
+
+    def resolve(self) -> Optional[Listener]:
+        """Return the live callback, or None once a weak owner is collected."""
+        return self.callback() if self.weak else self.callback
 
 
 class BioWorld:
@@ -64,7 +87,12 @@ class BioWorld:
         self._last_published_refs: set[tuple[str, str]] = set()
         self._current_time: float = 0.0
         self._is_setup: bool = False
-        self._listeners: List[Listener] = []
+        # Rebuilt on on()/off() so _emit can iterate them without copying, even
+        # while another thread (de)registers a listener mid-run. The per-event
+        # index lets STEP emits skip listeners that only watch lifecycle events.
+        self._listeners: Tuple[ListenerRegistration, ...] = ()
+        self._listeners_by_event: Dict[WorldEvent, Tuple[ListenerRegistration, ...]] = {}
+        self._visualize_failures: Dict[str, int] = {}
         self._active_run_start: Optional[float] = None
         self._active_run_end: Optional[float] = None
         self._setup_config: Dict[str, Dict[str, Any]] = {}
@@ -74,28 +102,104 @@ class BioWorld:
         self._run_event.set()
 
     # --- Listener management -----------------------------------------
-    def on(self, listener: Listener) -> None:
-        self._listeners.append(listener)
+    def on(
+        self,
+        listener: Listener,
+        events: Union[WorldEvent, Iterable[WorldEvent], None] = None,
+        *,
+        weak: bool = False,
+    ) -> None:
+        """Register ``listener`` for world events.
+
+        ``events`` restricts delivery to the given event type(s); by default
+        the listener receives every event. With ``weak=True`` a bound method is
+        held weakly, so a registered UI widget or module can still be
+        collected; it simply stops receiving events once it is gone.
+        """
+        if isinstance(events, WorldEvent):
+            events = frozenset((events,))
+        elif events is not None:
+            # A string is iterable too, but its characters are never events.
+            valid = not isinstance(events, (str, bytes)) and isinstance(events, Iterable)
+            if valid:
+                events = frozenset(events)
+                valid = all(isinstance(event, WorldEvent) for event in events)
+            if not valid:
+                raise TypeError(f"events must be a WorldEvent or an iterable of WorldEvent members, got {events!r}")
+        weak = weak and inspect.ismethod(listener)
+        registration = ListenerRegistration(
+            callback=weakref.WeakMethod(listener) if weak else listener,
+            events=events,
+            weak=weak,
+        )
+        self._listeners = self._listeners + (registration,)
+        self._index_listeners()
 
     def off(self, listener: Listener) -> None:
-        try:
-            self._listeners.remove(listener)
-        except ValueError:
-            pass
+        """Remove the earliest registration of ``listener``, if any."""
+        listeners = self._listeners
+        for index, registration in enumerate(listeners):
+            if registration.resolve() == listener:
+                self._listeners = listeners[:index] + listeners[index + 1:]
+                self._index_listeners()
+                return
+
+    def _index_listeners(self) -> None:
+        by_event: Dict[WorldEvent, Tuple[ListenerRegistration, ...]] = {}
+        for event in WorldEvent:
+            subscribed = tuple(
+                registration
+                for registration in self._listeners
+                if registration.events is None or event in registration.events
+            )
+            if subscribed:
+                by_event[event] = subscribed
+        self._listeners_by_event = by_event
 
     def _emit(self, event: WorldEvent, payload: Optional[Dict[str, Any]] = None) -> None:
+        listeners = self._listeners_by_event.get(event)
+        if not listeners:
+            return
         data = payload or {}
-        for listener in list(self._listeners):
+        dead: List[ListenerRegistration] = []
+        for registration in listeners:
+            listener = registration.resolve()
+            if listener is None:
+                dead.append(registration)
+                continue
             try:
                 listener(event, data)
             except Exception:
-                logger.exception("world listener raised during %s", event)
+                # A listener that fails on every step would otherwise log a
+                # traceback per emit; report the first few, then go quiet.
+                registration.failures += 1
+                failures = registration.failures
+                if failures <= MAX_LOGGED_LISTENER_FAILURES:
+                    logger.exception("world listener raised during %s", event)
+                if failures == MAX_LOGGED_LISTENER_FAILURES:
+                    logger.warning("suppressing further errors from world listener %r", listener)
+        if dead:
+            logger.debug("dropping %d world listener(s) whose owner was garbage-collected", len(dead))
+            self._listeners = tuple(
+                registration for registration in self._listeners if not any(registration is d for d in dead)
+            )
+            self._index_listeners()
 
-    def _progress_payload(self, now: Optional[float] = None) -> Dict[str, float]:
+    def _progress_payload(
+        self,
+        now: Optional[float] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Return run progress fields, written into ``payload`` when given.
+
+        Event payloads pass their own dict so each emit allocates one mapping
+        instead of building a progress dict and merging it into another.
+        """
+        out: Dict[str, Any] = {} if payload is None else payload
         start = self._active_run_start
         end = self._active_run_end
         if start is None or end is None:
-            return {}
+            return out
         sim_time = self._current_time if now is None else now
         duration = max(0.0, end - start)
         if duration <= 0.0:
@@ -103,14 +207,13 @@ class BioWorld:
         else:
             progress = (sim_time - start) / duration
         progress = max(0.0, min(1.0, progress))
-        return {
-            "start": start,
-            "end": end,
-            "duration": duration,
-            "progress": progress,
-            "progress_pct": progress * 100.0,
-            "remaining": max(0.0, end - sim_time),
-        }
+        out["start"] = start
+        out["end"] = end
+        out["duration"] = duration
+        out["progress"] = progress
+        out["progress_pct"] = progress * 100.0
+        out["remaining"] = max(0.0, end - sim_time)
+        return out
 
     # --- Module registration -----------------------------------------
     def add_biomodule(
@@ -120,6 +223,10 @@ class BioWorld:
     ) -> None:
         if name in self._modules and self._modules[name].module is not module:
             raise ValueError(f"Module name already registered: {name}")
+        # Like the refs in connect(), module names key the signal store and
+        # connection tables probed every window, so intern them too.
+        if type(name) is str:
+            name = sys.intern(name)
 
         input_specs = self._normalize_port_specs(module.inputs(), direction="input", module_name=name)
         output_specs = self._normalize_port_specs(module.outputs(), direction="output", module_name=name)
@@ -135,6 +242,10 @@ class BioWorld:
             input_specs=input_specs,
             output_specs=output_specs,
         )
+        # Connections cache the target port spec bound at connect() time;
+        # re-registering the name re-reads the ports, so rebind them.
+        for conn in self._connections_by_target.get(name, ()):
+            conn.target_spec = input_specs.get(conn.target_signal)
 
     def _normalize_port_specs(
         self,
@@ -158,7 +269,7 @@ class BioWorld:
                     f"Module '{module_name}' {direction} port '{port}' must declare a SignalSpec, got {type(spec)!r}"
                 )
             validate_port_spec_direction(spec, direction=direction)
-            normalized[port] = spec
+            normalized[sys.intern(str(port))] = spec
         return normalized
 
     # --- Wiring -------------------------------------------------------
@@ -167,8 +278,10 @@ class BioWorld:
         dst_parts = target.rsplit(".", 1)
         if len(src_parts) != 2 or len(dst_parts) != 2:
             raise ValueError("Source and target must be in format 'module.signal'")
-        src_mod, src_sig = src_parts
-        dst_mod, dst_sig = dst_parts
+        # Names parsed from wiring files are fresh strings; intern them so the
+        # per-window dict lookups keyed by them can match on identity.
+        src_mod, src_sig = map(sys.intern, src_parts)
+        dst_mod, dst_sig = map(sys.intern, dst_parts)
         if src_mod not in self._modules:
             raise KeyError(f"Unknown source module '{src_mod}'")
         if dst_mod not in self._modules:
@@ -180,13 +293,15 @@ class BioWorld:
             raise KeyError(f"Unknown source signal '{src_mod}.{src_sig}'")
         if dst_sig not in dst_entry.input_specs:
             raise KeyError(f"Unknown target signal '{dst_mod}.{dst_sig}'")
-        validate_connection_specs(src_entry.output_specs[src_sig], dst_entry.input_specs[dst_sig])
+        target_spec = dst_entry.input_specs[dst_sig]
+        validate_connection_specs(src_entry.output_specs[src_sig], target_spec)
 
         conn = Connection(
             source_module=src_mod,
             source_signal=src_sig,
             target_module=dst_mod,
             target_signal=dst_sig,
+            target_spec=target_spec,
         )
         self._connections_by_target.setdefault(dst_mod, []).append(conn)
 
@@ -221,24 +336,27 @@ class BioWorld:
                 raise TypeError(
                     f"Module '{module_name}' output '{port}' must be a typed BioSignal, got {type(signal)!r}"
                 )
-            bound = signal.with_spec(declared[port]) if signal.spec is None else signal.with_spec(declared[port])
-            if bound.source != module_name:
-                bound = bound.__class__(
+            # Bind spec, source, and port name in a single copy rather than
+            # cloning the value once per field that needs rewriting.
+            if signal.source == module_name and signal.name == port:
+                bound = signal.with_spec(declared[port])
+            else:
+                bound = signal.__class__(
                     source=module_name,
-                    name=bound.name,
-                    value=copy.deepcopy(bound.value),
-                    emitted_at=bound.emitted_at,
-                    spec=bound.spec,
+                    name=port,
+                    value=copy.deepcopy(signal.value),
+                    emitted_at=signal.emitted_at,
+                    spec=declared[port],
                 )
-            if bound.name != port:
-                bound = bound.retarget(name=port)
             normalized[port] = bound
         return normalized
 
-    def _commit_outputs(self, module_name: str, outputs: Mapping[str, BioSignal]) -> None:
+    def _commit_outputs(self, module_name: str, outputs: Dict[str, BioSignal]) -> None:
+        # Callers hand over the fresh dict from _normalize_outputs, so it is
+        # stored as-is instead of being copied again.
         if not outputs:
             return
-        self._signal_store[module_name] = dict(outputs)
+        self._signal_store[module_name] = outputs
 
     def _warn_if_input_stale(self, conn: Connection, source_signal: BioSignal, target_spec: SignalSpec, now: float) -> None:
         if source_signal.kind == "event":
@@ -275,14 +393,22 @@ class BioWorld:
 
     def _collect_inputs(self, target_name: str, start: float) -> Dict[str, BioSignal]:
         inputs: Dict[str, BioSignal] = {}
-        entry = self._modules[target_name]
-        for conn in self._connections_by_target.get(target_name, []):
-            source_outputs = self._signal_store.get(conn.source_module, {})
-            source_signal = source_outputs.get(conn.source_signal)
+        connections = self._connections_by_target.get(target_name)
+        if not connections:
+            return inputs
+        signal_store = self._signal_store
+        for conn in connections:
+            source_outputs = signal_store.get(conn.source_module)
+            source_signal = source_outputs.get(conn.source_signal) if source_outputs else None
             if source_signal is None:
                 continue
-            target_spec = entry.input_specs[conn.target_signal]
-            self._warn_if_input_stale(conn, source_signal, target_spec, start)
+            # Target specs are bound when the connection is made, so the hot
+            # path never goes back through the module's port table.
+            target_spec = conn.target_spec
+            if target_spec is None:
+                target_spec = self._modules[target_name].input_specs[conn.target_signal]
+            if target_spec.max_age is not None:
+                self._warn_if_input_stale(conn, source_signal, target_spec, start)
             if source_signal.kind == "event":
                 if conn.last_event_time is not None and source_signal.emitted_at <= conn.last_event_time:
                     continue
@@ -304,67 +430,83 @@ class BioWorld:
 
         self._stop_requested = False
         self._run_event.set()
-        self._emit(WorldEvent.STARTED, {"t": self._current_time, **self._progress_payload(self._current_time)})
-
+        self._emit(WorldEvent.STARTED, self._progress_payload(self._current_time, {"t": self._current_time}))
+
+        # Module order is fixed for the duration of a run, so walk one tuple
+        # per phase instead of fresh dict views every window.
+        entries = tuple((name, entry.module) for name, entry in self._modules.items())
+        # Window boundaries sit on a fixed grid anchored at the run start, so
+        # derive each one from its index rather than accumulating steps (which
+        # drifts and can leave a sliver window just before end_time).
+        run_start = self._current_time
+        step = self.communication_step
+        window_index = 0
+        # Bind the per-window callables once; the loop body then uses local
+        # loads instead of repeated attribute lookups on self.
+        run_event = self._run_event
+        collect_inputs = self._collect_inputs
+        normalize_outputs = self._normalize_outputs
+        commit_outputs = self._commit_outputs
+        step_event = WorldEvent.STEP
         try:
             while self._current_time < end_time - eps:
                 if self._stop_requested:
                     raise SimulationStop()
 
-                self._run_event.wait()
+                # is_set() is a plain flag read; only a paused run takes the
+                # Event's internal lock to block until request_resume().
+                if not run_event.is_set():
+                    run_event.wait()
 
                 if self._stop_requested:
                     raise SimulationStop()
 
                 window_start = self._current_time
-                window_end = min(window_start + self.communication_step, end_time)
-                window_inputs = {
-                    name: self._collect_inputs(name, window_start)
-                    for name in self._modules.keys()
-                }
-
-                for name, entry in self._modules.items():
-                    inputs = window_inputs.get(name) or {}
+                window_index += 1
+                window_end = min(run_start + window_index * step, end_time)
+                # Inputs only read the committed signal store, which nothing
+                # touches until the commit below, so gather and deliver them in
+                # one pass over the modules.
+                for name, module in entries:
+                    inputs = collect_inputs(name, window_start)
                     if inputs:
-                        entry.module.set_inputs(inputs)
+                        module.set_inputs(inputs)
 
-                for entry in self._modules.values():
-                    entry.module.advance_window(window_start, window_end)
+                for _, module in entries:
+                    module.advance_window(window_start, window_end)
 
                 pending_outputs: Dict[str, Dict[str, BioSignal]] = {}
-                for name, entry in self._modules.items():
-                    pending_outputs[name] = self._normalize_outputs(name, entry.module.get_outputs() or {})
+                for name, module in entries:
+                    pending_outputs[name] = normalize_outputs(name, module.get_outputs() or {})
 
+                published_refs: set[tuple[str, str]] = set()
                 for name, outputs in pending_outputs.items():
-                    self._commit_outputs(name, outputs)
-
-                self._last_published_refs = {
-                    (name, port)
-                    for name, outputs in pending_outputs.items()
-                    for port in outputs.keys()
-                }
+                    commit_outputs(name, outputs)
+                    published_refs.update((name, port) for port in outputs)
+                self._last_published_refs = published_refs
                 self._current_time = window_end
 
-                self._emit(
-                    WorldEvent.STEP,
-                    {
-                        "t": self._current_time,
-                        "window_start": window_start,
-                        "window_end": window_end,
-                        **self._progress_payload(self._current_time),
-                    },
-                )
+                # Headless runs usually have no STEP listeners; skip building
+                # the per-window progress payload entirely in that case.
+                if self._listeners_by_event.get(step_event):
+                    self._emit(
+                        step_event,
+                        self._progress_payload(
+                            window_end,
+                            {"t": window_end, "window_start": window_start, "window_end": window_end},
+                        ),
+                    )
 
         except SimulationStop:
-            self._emit(WorldEvent.STOPPED, {"t": self._current_time, **self._progress_payload(self._current_time)})
+            self._emit(WorldEvent.STOPPED, self._progress_payload(self._current_time, {"t": self._current_time}))
         except Exception as exc:
             self._emit(
                 WorldEvent.ERROR,
-                {"t": self._current_time, "error": exc, **self._progress_payload(self._current_time)},
+                self._progress_payload(self._current_time, {"t": self._current_time, "error": exc}),
             )
             raise
         finally:
-            self._emit(WorldEvent.FINISHED, {"t": self._current_time, **self._progress_payload(self._current_time)})
+            self._emit(WorldEvent.FINISHED, self._progress_payload(self._current_time, {"t": self._current_time}))
             self._active_run_start = None
             self._active_run_end = None
 
@@ -383,6 +525,13 @@ class BioWorld:
         if not self._is_setup:
             self.setup()
 
+        # Index downstream modules by source port once so each settle turn
+        # only wakes modules fed by the previous turn's outputs.
+        targets_by_ref: Dict[tuple[str, str], set[str]] = {}
+        for conns in self._connections_by_target.values():
+            for conn in conns:
+                targets_by_ref.setdefault((conn.source_module, conn.source_signal), set()).add(conn.target_module)
+
         frontier = set(self._last_published_refs)
         for _ in range(steps):
             if self._stop_requested:
@@ -390,12 +539,9 @@ class BioWorld:
             if not frontier:
                 break
 
-            target_names = {
-                conn.target_module
-                for conns in self._connections_by_target.values()
-                for conn in conns
-                if (conn.source_module, conn.source_signal) in frontier
-            }
+            target_names: set[str] = set()
+            for ref in frontier:
+                target_names.update(targets_by_ref.get(ref, ()))
             if not target_names:
                 break
 
@@ -434,23 +580,27 @@ class BioWorld:
 
     def request_pause(self) -> None:
         self._run_event.clear()
-        self._emit(WorldEvent.PAUSED, {"t": self._current_time, **self._progress_payload(self._current_time)})
+        self._emit(WorldEvent.PAUSED, self._progress_payload(self._current_time, {"t": self._current_time}))
 
     def request_resume(self) -> None:
         self._run_event.set()
-        self._emit(WorldEvent.RESUMED, {"t": self._current_time, **self._progress_payload(self._current_time)})
+        self._emit(WorldEvent.RESUMED, self._progress_payload(self._current_time, {"t": self._current_time}))
 
     # --- Snapshot / restore ------------------------------------------
     def snapshot(self) -> Dict[str, Any]:
+        state = self._snapshot_state()
+        state["signal_store"] = {
+            module_name: {port: signal.to_dict() for port, signal in outputs.items()}
+            for module_name, outputs in self._signal_store.items()
+        }
+        return state
+
+    def _snapshot_state(self) -> Dict[str, Any]:
         return {
             "communication_step": self.communication_step,
             "current_time": self._current_time,
             "is_setup": self._is_setup,
             "setup_config": copy.deepcopy(self._setup_config),
-            "signal_store": {
-                module_name: {port: signal.to_dict() for port, signal in outputs.items()}
-                for module_name, outputs in self._signal_store.items()
-            },
             "last_published_refs": [
                 {"module": module_name, "port": port}
                 for module_name, port in sorted(self._last_published_refs)
@@ -519,7 +669,9 @@ class BioWorld:
                 conn.last_stale_warning_time = raw.get("last_stale_warning_time")
 
     def branch(self) -> "BioWorld":
-        snapshot = self.snapshot()
+        # The branch lives in this process, so skip the JSON wire form for
+        # stored signals (array ``tolist()`` and back) and copy them directly.
+        snapshot = self._snapshot_state()
         branched = BioWorld(communication_step=self.communication_step)
         for name, entry in self._modules.items():
             try:
@@ -533,6 +685,10 @@ class BioWorld:
             for conn in connections:
                 branched.connect(f"{conn.source_module}.{conn.source_signal}", f"{target}.{conn.target_signal}")
         branched.restore(copy.deepcopy(snapshot))
+        branched._signal_store = {
+            module_name: {port: signal.copy() for port, signal in outputs.items()}
+            for module_name, outputs in self._signal_store.items()
+        }
         return branched
 
     # --- Introspection ------------------------------------------------
@@ -554,7 +710,14 @@ class BioWorld:
             try:
                 visuals = module.visualize()  # type: ignore[attr-defined]
             except Exception:
-                logger.exception("BioModule.visualize raised for %s", module.__class__.__name__)
+                # UIs poll visuals while a run is live; keep calling (the
+                # failure may be transient) but stop logging a traceback per poll.
+                failures = self._visualize_failures.get(entry.name, 0) + 1
+                self._visualize_failures[entry.name] = failures
+                if failures <= MAX_LOGGED_VISUALIZE_FAILURES:
+                    logger.exception("BioModule.visualize raised for %s", module.__class__.__name__)
+                if failures == MAX_LOGGED_VISUALIZE_FAILURES:
+                    logger.warning("suppressing further visualize errors from module '%s'", entry.name)
                 continue
             if not visuals:
                 continue
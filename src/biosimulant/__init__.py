@@ -11,25 +11,37 @@ from __future__ import annotations
 
 import importlib
 import sys
+from types import ModuleType
 from typing import Any
 
 import biosim as _biosim
-from biosim import *  # noqa: F401,F403
 from biosim import __all__ as __all__
 from biosim import __version__ as __version__
 
+# Re-export what biosim has already bound. Names it resolves lazily (the cloud
+# client pulls in httpx) are forwarded on first access by __getattr__.
+globals().update({_name: vars(_biosim)[_name] for _name in __all__ if _name in vars(_biosim)})
+
+# Aliased on first access instead, so `import biosimulant` stays as cheap as
+# `import biosim`.
+_LAZY_SUBMODULES = frozenset({"cloud"})
+
 
 def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        module: ModuleType = importlib.import_module(f"biosim.{name}")
+        sys.modules[f"{__name__}.{name}"] = module
+        globals()[name] = module
+        return module
     return getattr(_biosim, name)
 
 
 def __dir__() -> list[str]:
-    return sorted([*__all__, "onnx"])
+    return sorted([*__all__, "cloud", "onnx"])
 
 
 _ALIASED_SUBMODULES = (
     "contrib",
-    "cloud",
     "contrib.cellml",
     "contrib.sbml",
     "credentials",
@@ -37,3 +37,26 @@ def test_dir_excludes_simui():
     assert "OnnxClassifierModule" in names
     assert "__version__" in names
     assert names == sorted(names)
+
+
+def test_cloud_exports_resolve_lazily():
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    script = (
+        "import sys\n"
+        "import biosim\n"
+        "assert 'biosim.cloud' not in sys.modules, 'biosim.cloud imported eagerly'\n"
+        "assert 'httpx' not in sys.modules, 'httpx imported eagerly'\n"
+        "from biosim.cloud import Client\n"
+        "assert biosim.Client is Client\n"
+        "assert {'Client', 'cloud'} <= set(biosim.__dir__())\n"
+    )
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {src!r})\n{script}"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -82,3 +82,28 @@ def test_release_version_targets_first_biosimulant_package() -> None:
         ns,
     )
     assert biosimulant.__version__ == ns["__version__"]
+
+
+def test_biosimulant_import_does_not_load_cloud_client() -> None:
+    import subprocess
+    import sys
+
+    script = (
+        "import sys\n"
+        "import biosimulant\n"
+        "assert 'biosim.cloud' not in sys.modules, 'biosim.cloud imported eagerly'\n"
+        "assert 'httpx' not in sys.modules, 'httpx imported eagerly'\n"
+        "import biosim.cloud\n"
+        "from biosimulant import cloud\n"
+        "from biosimulant.cloud import Client\n"
+        "assert cloud is biosimulant.cloud is biosim.cloud\n"
+        "assert biosimulant.Client is Client is biosim.Client\n"
+        "assert biosim.cloud.__spec__.name == 'biosim.cloud'\n"
+    )
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {src!r})\n{script}"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -326,6 +326,58 @@ def test_advance_window_publishes_typed_cellml_signals(tmp_path) -> None:
     assert outputs["mean_state_x"].value == pytest.approx((1.0 + 0.5 + 0.25) / 3.0)
 
 
+def test_rhs_accepts_ndarray_states_and_isolates_window_variables(tmp_path) -> None:
+    np = pytest.importorskip("numpy")
+    model_file = tmp_path / "model.cellml"
+    model_file.write_text("<model />")
+    module = _fake_generated_module()
+
+    def compute_rates(t: float, states: list[float], rates: list[float], variables: list[float]) -> None:
+        variables[0] += 100.0
+        rates[0] = -float(states[0]) + variables[0]
+
+    module.compute_rates = compute_rates
+    seen: list[list[float]] = []
+
+    def solver(rhs, span, y0, *, t_eval):
+        seen.append(rhs(0.0, np.asarray([1.0])))
+        seen.append(rhs(0.5, np.asarray([1.0])))
+        return _FakeSolverResult()
+
+    wrapper = LibCellMLBioModule(str(model_file), generated_module=module, solver=solver)
+    wrapper.setup()
+    baseline = list(wrapper._variables)
+    wrapper._simulate_window(0.0, 1.0)
+
+    assert seen[0] == seen[1] == [-1.0 + baseline[0] + 100.0]
+    assert all(type(value) is float for value in seen[0])
+
+
+def test_scipy_solver_receives_declared_integration_method(tmp_path, monkeypatch) -> None:
+    model_file = tmp_path / "model.cellml"
+    model_file.write_text("<model />")
+    calls: list[dict[str, object]] = []
+
+    def solve_ivp(rhs, span, y0, *, t_eval, **kwargs):
+        calls.append(kwargs)
+        return _FakeSolverResult()
+
+    scipy_module = types.ModuleType("scipy")
+    integrate_module = types.ModuleType("scipy.integrate")
+    integrate_module.solve_ivp = solve_ivp
+    scipy_module.integrate = integrate_module
+    monkeypatch.setitem(sys.modules, "scipy", scipy_module)
+    monkeypatch.setitem(sys.modules, "scipy.integrate", integrate_module)
+
+    class StiffWrapper(LibCellMLBioModule):
+        _SOLVER_METHOD = "LSODA"
+
+    wrapper = StiffWrapper(str(model_file), generated_module=_fake_generated_module())
+    wrapper.advance_window(0.0, 1.0)
+
+    assert calls == [{"method": "LSODA"}]
+
+
 def test_source_variable_named_t_does_not_clobber_simulation_time(tmp_path) -> None:
     model_file = tmp_path / "model.cellml"
     model_file.write_text("<model />")
@@ -708,3 +760,50 @@ def test_libcellml_wrapper_overrides_reset_failure_and_no_state_paths(tmp_path)
 
     wrapper.reset()
     assert wrapper.get_outputs()["state"].value == {"y": 4.0}
+
+
+@pytest.mark.parametrize(
+    "y_values",
+    [
+        [],
+        [[1.0, 0.5]],
+    ],
+)
+def test_libcellml_wrapper_rejects_solutions_missing_samples(tmp_path, y_values) -> None:
+    model_file = tmp_path / "model.cellml"
+    model_file.write_text("<model />")
+
+    class ShortResult:
+        success = True
+        t = [0.0, 0.5, 1.0]
+        y = y_values
+
+    wrapper = LibCellMLBioModule(
+        str(model_file),
+        generated_module=_fake_generated_module(),
+        solver=lambda rhs, span, y0, *, t_eval: ShortResult(),
+    )
+    wrapper.setup()
+    history = list(wrapper._history)
+
+    with pytest.raises(CellMLRuntimeError, match="expected 1 states at each of 3 times"):
+        wrapper.advance_window(0.0, 1.0)
+    assert wrapper._history == history
+
+
+def test_summary_peaks_fold_new_rows_and_rescan_after_trim(tmp_path) -> None:
+    model_file = tmp_path / "model.cellml"
+    model_file.write_text("<model />")
+
+    class Wrapper(LibCellMLBioModule):
+        _OBSERVABLES = ["x", "y"]
+
+    wrapper = Wrapper(str(model_file), generated_module=_fake_generated_module(), solver=_fake_solver)
+    wrapper._history = [{"t": 0.0, "x": 5.0, "y": -1.0}, {"t": 1.0, "x": 1.0, "y": 0.0}]
+
+    assert wrapper._history_peaks() == [5.0, 0.0]
+    wrapper._history.append({"t": 2.0, "x": 2.0, "y": 3.0})
+    assert wrapper._history_peaks() == [5.0, 3.0]
+    del wrapper._history[:1]
+    assert wrapper._history_peaks() == [2.0, 3.0]
+    assert wrapper._compute_summary(2.0)["peak_observable"] == "y"
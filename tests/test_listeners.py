@@ -1,3 +1,6 @@
+import pytest
+
+
 
 def test_listener_on_off(biosim):
     world = biosim.BioWorld(communication_step=0.1)
@@ -25,3 +28,149 @@ def test_listener_on_off(biosim):
     world.off(listener)
     world.run(duration=0.1)
     assert called["n"] == 0
+
+
+def test_listener_removed_during_emit_does_not_skip_others(biosim):
+    world = biosim.BioWorld(communication_step=0.1)
+    seen = []
+
+    class Idle(biosim.BioModule):
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    world.add_biomodule("idle", Idle())
+
+    def once(ev, _payload):
+        seen.append(("once", ev))
+        world.off(once)
+
+    def always(ev, _payload):
+        seen.append(("always", ev))
+
+    world.on(once)
+    world.on(always)
+    world.run(duration=0.1)
+
+    assert seen[:2] == [("once", biosim.WorldEvent.STARTED), ("always", biosim.WorldEvent.STARTED)]
+    assert [name for name, _ in seen].count("once") == 1
+
+
+def test_bound_method_listeners_are_strong_unless_weak_is_requested(biosim):
+    import gc
+
+    world = biosim.BioWorld(communication_step=0.1)
+    seen = []
+
+    class Idle(biosim.BioModule):
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    class Panel:
+        def __init__(self, tag):
+            self.tag = tag
+
+        def handle(self, ev, _payload):
+            seen.append((self.tag, ev))
+
+    world.add_biomodule("idle", Idle())
+    kept = Panel("kept")
+    removed = Panel("removed")
+    world.on(kept.handle, weak=True)
+    world.on(Panel("temporary").handle)
+    world.on(Panel("dropped").handle, weak=True)
+    world.on(removed.handle, weak=True)
+    world.off(removed.handle)
+    gc.collect()
+
+    world.run(duration=0.1)
+
+    assert {tag for tag, _ in seen} == {"kept", "temporary"}
+    assert len(world._listeners) == 2
+
+
+def test_listener_can_subscribe_to_selected_events(biosim):
+    world = biosim.BioWorld(communication_step=0.1)
+    lifecycle = []
+    everything = []
+
+    class Idle(biosim.BioModule):
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    def on_lifecycle(ev, _payload):
+        lifecycle.append(ev)
+
+    world.add_biomodule("idle", Idle())
+    world.on(on_lifecycle, events=(biosim.WorldEvent.STARTED, biosim.WorldEvent.FINISHED))
+    world.on(lambda ev, _payload: everything.append(ev))
+    world.run(duration=0.3)
+
+    assert lifecycle == [biosim.WorldEvent.STARTED, biosim.WorldEvent.FINISHED]
+    assert everything.count(biosim.WorldEvent.STEP) == 3
+
+    world.off(on_lifecycle)
+    world.run(duration=0.1)
+    assert lifecycle == [biosim.WorldEvent.STARTED, biosim.WorldEvent.FINISHED]
+
+
+def test_each_registration_keeps_its_own_event_filter(biosim):
+    world = biosim.BioWorld(communication_step=0.1)
+    seen = []
+
+    class Idle(biosim.BioModule):
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    def record(ev, _payload):
+        seen.append(ev)
+
+    world.add_biomodule("idle", Idle())
+    world.on(record, events={biosim.WorldEvent.STARTED})
+    world.on(record, events={biosim.WorldEvent.FINISHED})
+    world.run(duration=0.1)
+
+    assert seen == [biosim.WorldEvent.STARTED, biosim.WorldEvent.FINISHED]
+
+    seen.clear()
+    world.off(record)
+    world.run(duration=0.1)
+    assert seen == [biosim.WorldEvent.FINISHED]
+
+
+def test_single_event_filter_is_accepted(biosim):
+    world = biosim.BioWorld(communication_step=0.1)
+    seen = []
+
+    class Idle(biosim.BioModule):
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    world.add_biomodule("idle", Idle())
+    world.on(lambda ev, _payload: seen.append(ev), events=biosim.WorldEvent.FINISHED)
+    world.run(duration=0.1)
+
+    assert seen == [biosim.WorldEvent.FINISHED]
+
+
+@pytest.mark.parametrize("events", ["step", ["step"], 5])
+def test_invalid_event_filters_are_rejected(biosim, events):
+    world = biosim.BioWorld(communication_step=0.1)
+
+    with pytest.raises(TypeError, match="WorldEvent"):
+        world.on(lambda ev, _payload: None, events=events)
+    assert world._listeners == ()
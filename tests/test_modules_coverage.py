@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 
 def _minimal_module(biosim):
     class Minimal(biosim.BioModule):
@@ -113,6 +115,63 @@ def test_stateful_biomodule_runs_fixed_steps(biosim):
     assert result["value"].emitted_at == 1.0
 
 
+def test_stateful_biomodule_step_times_do_not_drift(biosim):
+    class Recorder(biosim.StatefulBioModule):
+        def __init__(self):
+            super().__init__(integration_step=0.1)
+            self.steps = []
+
+        def step(self, h):
+            self.steps.append(h)
+
+        def record_state(self, t):
+            self._history.append(t)
+
+    module = Recorder()
+    module.advance_window(0.0, 1.05)
+
+    assert len(module.steps) == 11
+    assert module.history[:-1] == [index * 0.1 for index in range(1, 11)]
+    assert module.history[-1] == 1.05
+    assert sum(module.steps) == pytest.approx(1.05)
+
+
+def test_stateful_biomodule_history_stays_bounded_within_long_window(biosim):
+    class Recorder(biosim.StatefulBioModule):
+        def __init__(self):
+            super().__init__(integration_step=0.1, max_history_points=10)
+            self.peak = 0
+
+        def record_state(self, t):
+            self._history.append(t)
+            self.peak = max(self.peak, len(self._history))
+
+    module = Recorder()
+    module.advance_window(0.0, 100.0)
+
+    assert module.peak <= 2 * module.max_history_points + 1
+    assert len(module.history) == 10
+    assert module.history[-1] == 100.0
+
+
+def test_stateful_biomodule_without_step_hooks_only_moves_clock(biosim):
+    class Clock(biosim.StatefulBioModule):
+        def __init__(self):
+            super().__init__(integration_step=1e-6)
+
+        def outputs(self):
+            return {"t": biosim.SignalSpec.scalar(dtype="float64")}
+
+        def output_payload(self, t):
+            return {"t": t}
+
+    module = Clock()
+    result = module.advance_window(0.0, 2.5)
+
+    assert module._time == 2.5
+    assert result["t"].value == 2.5
+
+
 def test_stateful_biomodule_validates_constructor_arguments(biosim):
     class Counter(biosim.StatefulBioModule):
         def advance_window(self, start, end):
@@ -195,3 +254,21 @@ def test_stateful_biomodule_can_skip_zero_window_publish(biosim):
     module = Counter()
 
     assert module.advance_window(0.0, 0.0) == {}
+
+
+def test_signal_emitter_get_outputs_returns_a_fresh_dict(biosim):
+    class Emitter(biosim.SignalEmitterBioModule):
+        def outputs(self):
+            return {"value": biosim.SignalSpec.scalar(dtype="float64")}
+
+        def advance_window(self, start, end):
+            self.publish_outputs(end, {"value": end})
+
+    module = Emitter()
+    module.advance_window(0.0, 1.0)
+    first = module.get_outputs()
+    first.pop("value")
+
+    assert module.get_outputs()["value"].value == 1.0
+    module.advance_window(1.0, 2.0)
+    assert first == {}
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from pathlib import Path
 from types import SimpleNamespace
 
 import numpy as np
 import pytest
 
-from biosim.onnx import _flatten_numeric_items
+from biosim.onnx import _flatten_numeric_items, _load_session
 
 
 class _FakeSession:
@@ -107,6 +108,10 @@ def test_flatten_numeric_items_handles_common_model_output_shapes() -> None:
     assert _flatten_numeric_items((1, 2, "bad")) == [1.0, 2.0]
     assert _flatten_numeric_items(4) == [4.0]
     assert _flatten_numeric_items({"not": "numeric"}) == []
+    assert _flatten_numeric_items(np.asarray([[[0.5, 1]], [[2, 3]]])) == [0.5, 1.0]
+    assert _flatten_numeric_items(np.zeros((0, 3))) == []
+    assert _flatten_numeric_items(np.float32(2.5)) == [2.5]
+    assert _flatten_numeric_items(np.asarray([[0.25, "x"]], dtype=object)) == [0.25]
 
 
 def test_onnx_classifier_handles_missing_input_and_empty_session_result(biosim, tmp_path):
@@ -150,6 +155,10 @@ def test_onnx_classifier_handles_missing_input_and_empty_session_result(biosim,
     assert outputs["scores"].value == pytest.approx([1.0, 0.0])
     assert outputs["label"].value["label"] == "baseline"
     assert module.visualize()["data"]["items"][0] == {"label": "baseline", "value": 1.0}
+    visual = module.visualize()
+    assert module.visualize() is visual
+    module.advance_window(0.1, 0.2)
+    assert module.visualize() is not visual
 
 
 def test_onnx_classifier_pads_short_probabilities_and_round_trips_state(biosim):
@@ -193,3 +202,311 @@ def test_onnx_classifier_pads_short_probabilities_and_round_trips_state(biosim):
     assert state["_session"] is None
     restored.reset()
     assert restored.get_outputs() == {}
+
+
+def test_onnx_classifier_reuses_io_binding_buffer(biosim):
+    class FakeBinding:
+        def __init__(self) -> None:
+            self.inputs = []
+
+        def bind_input(self, name, device, device_id, dtype, shape, pointer):
+            self.inputs.append((name, device, dtype, tuple(shape)))
+
+        def bind_output(self, name, device):
+            self.output = (name, device)
+
+        def copy_outputs_to_cpu(self):
+            return [np.asarray([[0.8, 0.2]], dtype=np.float32)]
+
+    class BindingSession(_FakeSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.bindings = []
+            self.runs = 0
+
+        def get_inputs(self):
+            return [SimpleNamespace(name="state_vector", type="tensor(float)", shape=["batch", 2])]
+
+        def io_binding(self):
+            self.bindings.append(FakeBinding())
+            return self.bindings[-1]
+
+        def run_with_iobinding(self, binding):
+            self.runs += 1
+
+    session = BindingSession()
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["rest", "active"],
+        session_factory=lambda _path: session,
+        input_vector_length=2,
+    )
+    module.set_inputs({"state_vector": biosim.ArraySignal("adapter", "state_vector", [1.0, 2.0], 0.0)})
+    module.advance_window(0.0, 0.1)
+    module.advance_window(0.1, 0.2)
+
+    assert session.runs == 2
+    assert session.seen == []
+    assert len(session.bindings) == 1
+    assert session.bindings[0].inputs == [("state_vector", "cpu", np.float32, (1, 2))]
+    assert session.bindings[0].output == ("state_probabilities", "cpu")
+    assert module._input_buffer.tolist() == [[1.0, 2.0]]
+    assert module.get_outputs()["predicted_state"].value["label"] == "rest"
+    assert module.__getstate__()["_io_binding"] is None
+
+
+def test_onnx_classifier_runs_non_float_inputs_without_io_binding(biosim):
+    class DoubleSession(_FakeSession):
+        def get_inputs(self):
+            return [SimpleNamespace(name="state_vector", type="tensor(double)", shape=["batch", 2])]
+
+        def io_binding(self):
+            raise AssertionError("double inputs must not be bound to a float32 buffer")
+
+        def run_with_iobinding(self, binding):
+            raise AssertionError("double inputs must not be bound to a float32 buffer")
+
+    session = DoubleSession()
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["rest", "active", "spiking"],
+        session_factory=lambda _path: session,
+        input_vector_length=2,
+    )
+    module.set_inputs({"state_vector": biosim.ArraySignal("adapter", "state_vector", [1.0, 2.0], 0.0)})
+    module.advance_window(0.0, 0.1)
+
+    assert session.seen == [(("state_probabilities",), {"state_vector": [[1.0, 2.0]]})]
+    assert module.get_outputs()["predicted_state"].value["label"] == "spiking"
+
+
+@pytest.mark.parametrize(
+    ("shape", "features"),
+    [
+        ([4, 2], [1.0, 2.0]),
+        (["batch", 3], [1.0, 2.0]),
+        (["batch", 2, 1], [1.0, 2.0]),
+        (None, [1.0, 2.0]),
+    ],
+)
+def test_onnx_classifier_skips_io_binding_for_mismatched_input_shapes(biosim, shape, features):
+    class ShapedSession(_FakeSession):
+        def get_inputs(self):
+            return [SimpleNamespace(name="state_vector", type="tensor(float)", shape=shape)]
+
+        def io_binding(self):
+            raise AssertionError("input shape does not fit the (1, n) buffer")
+
+        def run_with_iobinding(self, binding):
+            raise AssertionError("input shape does not fit the (1, n) buffer")
+
+    session = ShapedSession()
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["rest", "active", "spiking"],
+        session_factory=lambda _path: session,
+    )
+    module.set_inputs({"state_vector": biosim.ArraySignal("adapter", "state_vector", features, 0.0)})
+    module.advance_window(0.0, 0.1)
+
+    assert len(session.seen) == 1
+
+
+def test_onnx_classifier_binds_input_and_output_buffers_as_ortvalues(biosim, monkeypatch):
+    import sys
+    import types
+
+    class FakeOrtValue:
+        def __init__(self, array) -> None:
+            self.array = array
+
+        @classmethod
+        def ortvalue_from_numpy(cls, array):
+            return cls(array)
+
+    class FakeBinding:
+        def bind_ortvalue_input(self, name, value):
+            self.input = (name, value)
+
+        def bind_ortvalue_output(self, name, value):
+            self.output = (name, value)
+
+        def copy_outputs_to_cpu(self):
+            raise AssertionError("static outputs are read from the bound buffer")
+
+    class BindingSession(_FakeSession):
+        def get_inputs(self):
+            return [SimpleNamespace(name="state_vector", type="tensor(float)", shape=["batch", 2])]
+
+        def get_outputs(self):
+            return [SimpleNamespace(name="state_probabilities", type="tensor(float)", shape=["batch", 2])]
+
+        def io_binding(self):
+            self.binding = FakeBinding()
+            return self.binding
+
+        def run_with_iobinding(self, binding):
+            binding.output[1].array[0, :] = [0.1, 0.9]
+
+    ort = types.ModuleType("onnxruntime")
+    ort.OrtValue = FakeOrtValue
+    monkeypatch.setitem(sys.modules, "onnxruntime", ort)
+    session = BindingSession()
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["rest", "active"],
+        session_factory=lambda _path: session,
+        input_vector_length=2,
+    )
+    module.set_inputs({"state_vector": biosim.ArraySignal("adapter", "state_vector", [3.0, 4.0], 0.0)})
+    module.advance_window(0.0, 0.1)
+
+    name, value = session.binding.input
+    assert name == "state_vector"
+    assert value.array is module._input_buffer
+    assert value.array.tolist() == [[3.0, 4.0]]
+    assert session.binding.output[1].array is module._output_buffer
+    assert module._output_buffer.shape == (1, 2)
+    assert module.get_outputs()["predicted_state"].value["label"] == "active"
+    assert module.__getstate__()["_input_ortvalue"] is None
+
+
+def test_onnx_default_session_factory_uses_tuned_session_options(biosim, monkeypatch):
+    import sys
+    import types
+
+    created = []
+    ort = types.ModuleType("onnxruntime")
+    ort.SessionOptions = SimpleNamespace
+    ort.GraphOptimizationLevel = SimpleNamespace(ORT_ENABLE_ALL="all")
+    ort.ExecutionMode = SimpleNamespace(ORT_SEQUENTIAL="sequential")
+    ort.InferenceSession = lambda path, **kwargs: created.append((path, kwargs)) or _FakeSession()
+    monkeypatch.setitem(sys.modules, "onnxruntime", ort)
+    _load_session.cache_clear()
+
+    module = biosim.OnnxClassifierModule(model_path="/tmp/model.onnx", class_labels=["a", "b", "c"])
+    module.advance_window(0.0, 0.1)
+    twin = biosim.OnnxClassifierModule(model_path="/tmp/model.onnx", class_labels=["a", "b", "c"])
+    twin.advance_window(0.0, 0.1)
+    _load_session.cache_clear()
+
+    assert len(created) == 1
+    assert twin._session is module._session
+    path, kwargs = created[0]
+    options = kwargs["sess_options"]
+    assert path == "/tmp/model.onnx"
+    assert kwargs["providers"] == ["CPUExecutionProvider"]
+    assert options.graph_optimization_level == "all"
+    assert options.execution_mode == "sequential"
+    assert (options.intra_op_num_threads, options.inter_op_num_threads) == (1, 1)
+
+
+def test_onnx_classifier_quantizes_model_once_per_revision(biosim, tmp_path, monkeypatch):
+    import sys
+    import types
+
+    source = tmp_path / "model.onnx"
+    source.write_bytes(b"fp32")
+    calls = []
+
+    def quantize_dynamic(model_input, model_output, **kwargs):
+        calls.append((model_input, model_output, kwargs))
+        Path(model_output).write_bytes(b"int8")
+
+    quantization = types.ModuleType("onnxruntime.quantization")
+    quantization.QuantType = SimpleNamespace(QInt8="qint8")
+    quantization.quantize_dynamic = quantize_dynamic
+    monkeypatch.setitem(sys.modules, "onnxruntime.quantization", quantization)
+
+    paths = []
+    for _ in range(2):
+        module = biosim.OnnxClassifierModule(
+            model_path="model.onnx",
+            base_dir=str(tmp_path),
+            class_labels=["a", "b", "c"],
+            session_factory=lambda path: paths.append(path) or _FakeSession(),
+            quantize="int8",
+        )
+        module.advance_window(0.0, 0.1)
+
+    assert paths == [str(tmp_path / "model.int8.onnx")] * 2
+    assert len(calls) == 1
+    assert calls[0][0] == str(source)
+    assert Path(calls[0][1]).parent == tmp_path
+    assert (tmp_path / "model.int8.onnx").read_bytes() == b"int8"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["model.int8.onnx", "model.onnx"]
+    assert calls[0][2]["weight_type"] == "qint8"
+    with pytest.raises(ValueError, match="quantization"):
+        biosim.OnnxClassifierModule(model_path="model.onnx", quantize="fp16")
+
+
+def test_onnx_classifier_falls_back_to_fp32_when_quantized_copy_cannot_be_written(
+    biosim, tmp_path, monkeypatch, caplog
+):
+    import sys
+    import types
+
+    source = tmp_path / "model.onnx"
+    source.write_bytes(b"fp32")
+
+    def quantize_dynamic(model_input, model_output, **kwargs):
+        Path(model_output).write_bytes(b"partial")
+        raise PermissionError("read-only model directory")
+
+    quantization = types.ModuleType("onnxruntime.quantization")
+    quantization.QuantType = SimpleNamespace(QInt8="qint8")
+    quantization.quantize_dynamic = quantize_dynamic
+    monkeypatch.setitem(sys.modules, "onnxruntime.quantization", quantization)
+
+    paths = []
+    module = biosim.OnnxClassifierModule(
+        model_path="model.onnx",
+        base_dir=str(tmp_path),
+        class_labels=["a", "b", "c"],
+        session_factory=lambda path: paths.append(path) or _FakeSession(),
+        quantize="int8",
+    )
+    module.advance_window(0.0, 0.1)
+
+    assert paths == [str(source)]
+    assert [path.name for path in tmp_path.iterdir()] == ["model.onnx"]
+    assert any("fp32 model" in record.message for record in caplog.records)
+
+
+def test_onnx_classifier_predict_batch_uses_one_session_call(biosim):
+    class BatchSession(_FakeSession):
+        def run(self, output_names, feed_dict):
+            self.seen.append((tuple(output_names), dict(feed_dict)))
+            return [np.asarray([[0.9, 0.1], [0.2]], dtype=object)]
+
+    session = BatchSession()
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["rest", "active"],
+        session_factory=lambda _path: session,
+        input_vector_length=2,
+    )
+
+    probs = module.predict_batch([[1.0, 2.0, 3.0], {"features": [4.0]}, [5.0, 6.0]])
+
+    assert len(session.seen) == 1
+    assert session.seen[0][1]["state_vector"] == [[1.0, 2.0], [4.0, 0.0], [5.0, 6.0]]
+    assert probs == [[0.9, 0.1], [0.2, 0.0], [1.0, 0.0]]
+    assert module.get_outputs() == {}
+    assert module.predict_batch([]) == []
+
+
+def test_onnx_classifier_reuses_output_specs_between_windows(biosim):
+    module = biosim.OnnxClassifierModule(
+        model_path="artifacts/demo.onnx",
+        class_labels=["a", "b", "c"],
+        session_factory=lambda _path: _FakeSession(),
+    )
+    module.advance_window(0.0, 0.1)
+    first = module.get_outputs()["state_probabilities"].spec
+    module.advance_window(0.1, 0.2)
+    assert module.get_outputs()["state_probabilities"].spec is first
+
+    module.probabilities_description = "Updated"
+    module.advance_window(0.2, 0.3)
+    assert module.get_outputs()["state_probabilities"].spec.description == "Updated"
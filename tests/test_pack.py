@@ -1545,3 +1545,14 @@ def test_lab_python_version_runtime_check_reports_interpreter_mismatch(
 def test_validate_lab_manifest_error_matrix(manifest, match: str) -> None:
     with pytest.raises(PackageError, match=match):
         pack_module._validate_lab_manifest(manifest)
+
+
+def test_safe_yaml_load_falls_back_to_pure_python_safe_loader(monkeypatch):
+    import yaml
+
+    from biosim._yaml import safe_yaml_load
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    assert safe_yaml_load(yaml, "a: 1\n") == {"a": 1}
+    with pytest.raises(yaml.YAMLError):
+        safe_yaml_load(yaml, "!!python/object/apply:os.getcwd []\n")
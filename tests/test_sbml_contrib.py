@@ -373,3 +373,401 @@ def test_tellurium_sbml_rule_observable_discovery_and_error_fallbacks(tmp_path)
     )
     assignment = RuleWrapper(str(assignment_file))
     assert assignment._discover_observables_from_xml()[0] == ["y"]
+
+
+def test_tellurium_simulate_window_converts_rows_and_skips_duplicate_start(tmp_path) -> None:
+    model_file = tmp_path / "model.xml"
+    model_file.write_text("<xml />")
+
+    class Wrapper(TelluriumSBMLBioModule):
+        _OBSERVABLES = ["raw_x", "raw_y"]
+
+        def visualisation_extra_selections(self):
+            return ["aux"]
+
+    wrapper = Wrapper(str(model_file), integration_step=0.5)
+    wrapper._runner = _FakeTelluriumRunner()
+    wrapper._history = [{"t": 0.0, "raw_x": 10.0, "raw_y": 20.0}]
+
+    rows = wrapper._simulate_window(0.0, 1.0)
+
+    assert rows == [
+        {"t": 0.5, "raw_x": 10.5, "raw_y": 20.5, "aux": 30.5},
+        {"t": 1.0, "raw_x": 11.0, "raw_y": 21.0, "aux": 31.0},
+    ]
+    assert all(type(value) is float for row in rows for value in row.values())
+
+
+def test_tellurium_module_parses_sbml_file_once_per_revision(tmp_path, monkeypatch) -> None:
+    from biosim.contrib import sbml as sbml_module
+
+    model_file = tmp_path / "model.xml"
+    model_file.write_text(
+        """<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"><model>
+        <listOfSpecies><species id="a"/></listOfSpecies>
+        </model></sbml>""",
+        encoding="utf-8",
+    )
+    calls = []
+    real_parse = sbml_module.ET.parse
+
+    def counting_parse(source):
+        calls.append(source)
+        return real_parse(source)
+
+    sbml_module._parse_sbml_root.cache_clear()
+    monkeypatch.setattr(sbml_module.ET, "parse", counting_parse)
+
+    first = TelluriumSBMLBioModule(str(model_file))
+    second = TelluriumSBMLBioModule(str(model_file))
+
+    assert first._observables == second._observables == ["a"]
+    assert first._discover_observables_from_xml()[0] == ["a"]
+    assert len(calls) == 1
+
+
+def test_tellurium_simulate_timecourse_uses_one_simulator_call(tmp_path) -> None:
+    model_file = tmp_path / "model.xml"
+    model_file.write_text("<xml />")
+
+    class CountingRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        def simulate(self, start, end, n_steps, *, selections):
+            self.calls += 1
+            return super().simulate(start, end, n_steps, selections=selections)
+
+    class Wrapper(TelluriumSBMLBioModule):
+        _OBSERVABLES = ["raw_x"]
+
+    wrapper = Wrapper(str(model_file))
+    runner = CountingRunner()
+    wrapper._runner = runner
+    wrapper._history = [{"t": 0.0, "raw_x": 10.0}]
+
+    columns = wrapper.simulate_timecourse(2.0, 5)
+
+    assert runner.calls == 1
+    assert columns == {"t": [0.0, 0.5, 1.0, 1.5, 2.0], "raw_x": [10.0, 10.5, 11.0, 11.5, 12.0]}
+    assert [row["t"] for row in wrapper._history] == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert wrapper._time == 2.0
+    assert wrapper.get_outputs()["state"].value == {"raw_x": 12.0}
+    assert wrapper.simulate_timecourse(1.0, 3) == {"t": [], "raw_x": []}
+
+    columns = wrapper.simulate_timecourse(3.0, 3)
+    assert columns == {"t": [2.0, 2.5, 3.0], "raw_x": [12.0, 12.5, 13.0]}
+    assert [row["t"] for row in wrapper._history][-3:] == [2.0, 2.5, 3.0]
+
+
+def test_tellurium_module_setup_reuses_loaded_runner(monkeypatch) -> None:
+    class ResettableRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reset_all_calls = 0
+
+        def resetAll(self) -> None:
+            self.reset_all_calls += 1
+            self["raw_x"] = 1.0
+
+    runner = ResettableRunner()
+    sources = []
+    tellurium = types.ModuleType("tellurium")
+    tellurium.loadSBMLModel = lambda source: sources.append(source) or runner
+    monkeypatch.setitem(sys.modules, "tellurium", tellurium)
+
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>")
+    wrapper._observables = ["raw_x"]
+    wrapper.setup()
+    runner["raw_x"] = 4.0
+    wrapper.setup()
+
+    assert len(sources) == 1
+    assert runner.reset_all_calls == 1
+    assert wrapper.get_outputs()["state"].value == {"raw_x": 1.0}
+
+
+def test_tellurium_module_loads_inline_sbml_without_a_file(monkeypatch) -> None:
+    sbml = """<sbml xmlns="http://www.sbml.org/sbml/level3/version1/core"><model>
+    <listOfSpecies><species id="raw_x"/></listOfSpecies>
+    </model></sbml>"""
+    sources = []
+    tellurium = types.ModuleType("tellurium")
+    tellurium.loadSBMLModel = lambda source: sources.append(source) or _FakeTelluriumRunner()
+    monkeypatch.setitem(sys.modules, "tellurium", tellurium)
+
+    wrapper = TelluriumSBMLBioModule(sbml_text=sbml)
+    assert wrapper._observables == ["raw_x"]
+
+    wrapper.setup()
+
+    assert sources == [sbml]
+    assert wrapper.get_outputs()["state"].value == {"raw_x": 1.0}
+    assert TelluriumSBMLBioModule(sbml_text="<broken")._observables == []
+    with pytest.raises(ValueError, match="model_path or sbml_text"):
+        TelluriumSBMLBioModule()
+
+
+def test_tellurium_headline_mean_only_reads_recent_window() -> None:
+    class Wrapper(TelluriumSBMLBioModule):
+        _HEADLINE_WINDOW_S = 2.0
+
+    wrapper = Wrapper(sbml_text="<sbml/>")
+    wrapper._history = [{"t": float(t), "x": float(t)} for t in range(10)] + [{"t": 10.0}]
+
+    assert wrapper._headline_value("x", {}, 10.0) == pytest.approx(8.5)
+    assert wrapper._headline_value("x", {"x": 4.0}, 20.0) == pytest.approx(4.0)
+
+
+def test_tellurium_summary_peaks_fold_new_rows_and_rescan_after_trim() -> None:
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>")
+    wrapper._observables = ["x", "y"]
+    wrapper._history = [{"t": 0.0, "x": 5.0, "y": -1.0}, {"t": 1.0, "x": 1.0}]
+
+    assert wrapper._history_peaks() == {"x": 5.0, "y": 0.0}
+    wrapper._history.append({"t": 2.0, "x": 2.0, "y": 3.0})
+    assert wrapper._history_peaks() == {"x": 5.0, "y": 3.0}
+    del wrapper._history[:1]
+    assert wrapper._history_peaks() == {"x": 2.0, "y": 3.0}
+    assert wrapper._compute_summary(2.0)["peak_observable"] == "y"
+
+
+def test_tellurium_module_restores_saved_state_for_repeated_models(monkeypatch) -> None:
+    import biosim.contrib.sbml as sbml_contrib
+
+    class StatefulRunner(_FakeTelluriumRunner):
+        loaded_states: list[str] = []
+
+        def saveStateS(self) -> str:
+            return "compiled-state"
+
+        def loadStateS(self, state: str) -> None:
+            self.loaded_states.append(state)
+
+    sources = []
+    tellurium = types.ModuleType("tellurium")
+    tellurium.loadSBMLModel = lambda source: sources.append(source) or StatefulRunner()
+    monkeypatch.setitem(sys.modules, "tellurium", tellurium)
+    monkeypatch.setattr(sbml_contrib, "_RUNNER_STATE_CACHE", {})
+
+    first = TelluriumSBMLBioModule(sbml_text="<sbml id='cached'/>")
+    second = TelluriumSBMLBioModule(sbml_text="<sbml id='cached'/>")
+    first._observables = second._observables = ["raw_x"]
+    first.setup()
+    second.setup()
+
+    assert sources == ["<sbml id='cached'/>"]
+    assert StatefulRunner.loaded_states == ["compiled-state"]
+    assert isinstance(second._runner, StatefulRunner)
+    assert second._runner is not first._runner
+
+
+def test_tellurium_overrides_are_written_in_batched_set_values_calls() -> None:
+    class BatchRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches = []
+
+        def setValues(self, ids, values) -> None:
+            if any(sbml_id not in self for sbml_id in ids):
+                raise RuntimeError("unknown id")
+            self.batches.append(list(ids))
+            self.update(zip(ids, values))
+
+        def __setitem__(self, sbml_id, value) -> None:
+            if sbml_id not in self:
+                raise KeyError(sbml_id)
+            super().__setitem__(sbml_id, value)
+
+    class Wrapper(TelluriumSBMLBioModule):
+        _PARAMETER_INPUTS = {"p_input": ("p", 2.0, "u", "Parameter p.")}
+        _INITIAL_CONDITION_INPUTS = {"x0": ("raw_x", 1.0, "u", "Initial x.")}
+        _ENABLE_PARAMETER_OVERRIDES = True
+
+    wrapper = Wrapper(sbml_text="<sbml/>")
+    wrapper._runner = runner = BatchRunner()
+    specs = wrapper.inputs()
+    wrapper._input_overrides = {
+        "p_input": ScalarSignal("test", "p_input", 3.0, 0.0, spec=specs["p_input"]),
+        "x0": ScalarSignal("test", "x0", 7.0, 0.0, spec=specs["x0"]),
+        "parameter_overrides": RecordSignal(
+            "test", "parameter_overrides", {"payload": {"aux": 4.0, "missing": 1.0}}, 0.0, spec=specs["parameter_overrides"]
+        ),
+    }
+
+    wrapper.apply_overrides(reset_initial_state=True)
+
+    assert runner.batches == [["p", "raw_x"]]
+    assert (runner["p"], runner["raw_x"], runner["aux"]) == (3.0, 7.0, 4.0)
+    assert "missing" not in runner
+
+
+def test_tellurium_reads_observables_in_one_get_values_call() -> None:
+    class BatchRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = []
+
+        def getValues(self, ids):
+            self.calls.append(list(ids))
+            if any(sbml_id not in self for sbml_id in ids):
+                raise RuntimeError("unknown id")
+            return np.asarray([self[sbml_id] for sbml_id in ids])
+
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>")
+    wrapper._runner = runner = BatchRunner()
+    wrapper._observables = ["raw_x", "raw_y"]
+
+    assert wrapper._read_observables() == {"raw_x": 1.0, "raw_y": 2.0}
+    assert runner.calls == [["raw_x", "raw_y"]]
+
+    wrapper._observables = ["raw_x", "missing"]
+    assert wrapper._read_observables() == {"raw_x": 1.0, "missing": 0.0}
+
+
+def test_tellurium_batches_listed_model_ids_and_item_accesses_the_rest(monkeypatch, caplog) -> None:
+    class ListingRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.update({"init(raw_x)": 1.0})
+            self.reads = []
+            self.writes = []
+
+        def getFloatingSpeciesIds(self):
+            return ["raw_x", "raw_y"]
+
+        def getGlobalParameterIds(self):
+            return ["p"]
+
+        def getValues(self, ids):
+            self.reads.append(list(ids))
+            return [self[sbml_id] for sbml_id in ids]
+
+        def setValues(self, ids, values):
+            self.writes.append(list(ids))
+            self.update(zip(ids, values))
+
+        def __setitem__(self, sbml_id, value) -> None:
+            if sbml_id not in self:
+                raise KeyError(sbml_id)
+            super().__setitem__(sbml_id, value)
+
+    runner = ListingRunner()
+    tellurium = types.ModuleType("tellurium")
+    tellurium.loadSBMLModel = lambda _source: runner
+    monkeypatch.setitem(sys.modules, "tellurium", tellurium)
+
+    class Wrapper(TelluriumSBMLBioModule):
+        _OBSERVABLES = ["raw_x", "init(raw_x)", "missing"]
+        _ENABLE_PARAMETER_OVERRIDES = True
+
+    wrapper = Wrapper(sbml_text="<sbml id='listed'/>")
+    specs = wrapper.inputs()
+    wrapper.set_inputs(
+        {
+            "parameter_overrides": RecordSignal(
+                "test",
+                "parameter_overrides",
+                {"payload": {"p": 4.0, "init(raw_x)": 9.0, "missing": 1.0}},
+                0.0,
+                spec=specs["parameter_overrides"],
+            )
+        }
+    )
+    wrapper.setup()
+
+    assert wrapper._model_ids == frozenset({"raw_x", "raw_y", "p"})
+    assert runner.writes[-1] == ["p"]
+    assert runner["init(raw_x)"] == 9.0
+    assert "missing" not in runner
+    wrapper.apply_overrides()
+    ignored = [record for record in caplog.records if "unknown SBML ids" in record.message]
+    assert [record.message.rsplit(": ", 1)[-1] for record in ignored] == ["missing"]
+    assert wrapper._read_observables() == {"raw_x": 1.0, "init(raw_x)": 9.0, "missing": 0.0}
+    assert runner.reads[-1] == ["raw_x"]
+
+
+def test_tellurium_short_window_integrates_with_one_step() -> None:
+    class SteppingRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.steps = []
+
+        def oneStep(self, start, step):
+            self.steps.append((start, step))
+            self["raw_x"] += step
+            return start + step
+
+        def simulate(self, *args, **kwargs):
+            raise AssertionError("short windows should not sample through simulate()")
+
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>", integration_step=1.0)
+    wrapper._runner = runner = SteppingRunner()
+    wrapper._observables = ["raw_x"]
+    wrapper._history = [{"t": 0.0, "raw_x": 1.0}]
+
+    wrapper.advance_window(0.0, 0.5)
+
+    assert runner.steps == [(0.0, 0.5)]
+    assert wrapper._history[-1] == {"t": 0.5, "raw_x": 1.5}
+    assert wrapper._time == 0.5
+
+
+def test_tellurium_snapshot_round_trips_model_state_in_batched_calls() -> None:
+    class StateRunner(_FakeTelluriumRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reads = []
+
+        def getFloatingSpeciesIds(self):
+            return ["raw_x", "raw_y"]
+
+        def getGlobalParameterIds(self):
+            return ["p"]
+
+        def getReactionIds(self):
+            return ["flux"]
+
+        def getValues(self, ids):
+            self.reads.append(list(ids))
+            return np.asarray([self[sbml_id] for sbml_id in ids])
+
+        def setValues(self, ids, values):
+            self.update(zip(ids, values))
+
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>")
+    wrapper._runner = runner = StateRunner()
+    wrapper._model_ids = wrapper._collect_model_ids()
+    wrapper._observables = ["raw_x"]
+    wrapper._time = 2.0
+    wrapper._history = [{"t": 0.0, "raw_x": 1.0}, {"t": 2.0, "raw_x": 1.0}]
+
+    snapshot = wrapper.snapshot()
+    assert runner.reads == [["raw_x", "raw_y", "p"]]
+    assert snapshot["values"] == {"raw_x": 1.0, "raw_y": 2.0, "p": 2.0}
+
+    runner.update(raw_x=50.0, p=9.0)
+    wrapper._history.append({"t": 3.0, "raw_x": 50.0})
+    wrapper.restore(snapshot)
+
+    assert (runner["raw_x"], runner["p"]) == (1.0, 2.0)
+    assert wrapper._time == 2.0
+    assert wrapper._history == [{"t": 0.0, "raw_x": 1.0}, {"t": 2.0, "raw_x": 1.0}]
+    assert wrapper.get_outputs()["state"].value == {"raw_x": 1.0}
+
+
+def test_tellurium_publish_outputs_reuses_specs_until_observables_change() -> None:
+    wrapper = TelluriumSBMLBioModule(sbml_text="<sbml/>")
+    wrapper._observables = ["raw_x"]
+    wrapper._history = [{"t": 0.0, "raw_x": 1.0}]
+
+    wrapper.publish_outputs(0.0)
+    first = wrapper.get_outputs()["state"].spec
+    wrapper._history.append({"t": 1.0, "raw_x": 2.0})
+    wrapper.publish_outputs(1.0)
+    assert wrapper.get_outputs()["state"].spec is first
+
+    wrapper._observables = ["raw_x", "raw_y"]
+    wrapper.publish_outputs(1.0)
+    assert wrapper.get_outputs()["state"].spec.schema == {"raw_x": "float", "raw_y": "float"}
@@ -197,6 +197,57 @@ def test_signal_constructor_argument_errors_and_clone_helpers() -> None:
         ArraySignal(source="src", name="a", value=[1], emitted_at=0.0, spec=SignalSpec.array(dtype="int64", shape=(1,))).as_float()
 
 
+def test_retarget_copies_value_without_sharing_mutable_state() -> None:
+    record = RecordSignal(source="src", name="r", value={"k": [1]}, emitted_at=0.5, spec=SignalSpec.record(schema={"k": "list"}))
+    array = ArraySignal(source="src", name="a", value=[1.0, 2.0], emitted_at=0.5, spec=SignalSpec.array(dtype="float64", shape=(2,)))
+
+    moved_record = record.retarget(name="r2")
+    moved_array = array.retarget(name="a2")
+    moved_record.value["k"].append(2)
+    moved_array.value[0] = 9.0
+
+    assert (moved_record.name, moved_record.source, moved_record.emitted_at) == ("r2", "src", 0.5)
+    assert moved_record.spec is record.spec
+    assert record.value == {"k": [1]}
+    assert array.value.tolist() == [1.0, 2.0]
+    assert moved_array.as_array().tolist() == [9.0, 2.0]
+
+
+def test_copy_keeps_identity_without_sharing_mutable_state() -> None:
+    array = ArraySignal(source="src", name="a", value=[1.0, 2.0], emitted_at=0.5, spec=SignalSpec.array(dtype="float64", shape=(2,)))
+
+    copied = array.copy()
+    copied.value[0] = 9.0
+
+    assert type(copied) is ArraySignal
+    assert (copied.name, copied.source, copied.emitted_at, copied.spec) == ("a", "src", 0.5, array.spec)
+    assert array.as_array().tolist() == [1.0, 2.0]
+    assert copied.as_array().tolist() == [9.0, 2.0]
+
+
+def test_array_signal_reuses_buffer_of_matching_dtype() -> None:
+    buffer = np.arange(3, dtype=np.float32)
+
+    signal = ArraySignal(source="src", name="a", value=buffer, emitted_at=0.0, spec=SignalSpec.array(dtype="float32", shape=(3,)))
+    widened = ArraySignal(source="src", name="a", value=buffer, emitted_at=0.0, spec=SignalSpec.array(dtype="float64", shape=(3,)))
+
+    assert signal.value is buffer
+    assert widened.value.dtype == np.float64
+    assert not np.shares_memory(widened.value, buffer)
+
+
+def test_builtin_signals_are_slotted_and_picklable() -> None:
+    import pickle
+
+    signal = ArraySignal(source="src", name="a", value=[1.0], emitted_at=0.5, spec=SignalSpec.array(dtype="float64", shape=(1,)))
+
+    assert not hasattr(signal, "__dict__")
+    assert not hasattr(ScalarSignal("src", "x", 1.0, 0.0), "__dict__")
+    restored = pickle.loads(pickle.dumps(signal))
+    assert restored.as_array().tolist() == [1.0]
+    assert restored.spec == signal.spec
+
+
 def test_scalar_signal_rejects_non_scalar_values() -> None:
     with pytest.raises(TypeError, match="scalar signals require"):
         ScalarSignal(source="src", name="x", value=[1], emitted_at=0.0, spec=SignalSpec.scalar(dtype="float64"))
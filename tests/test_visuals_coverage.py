@@ -50,6 +50,37 @@ def test_validate_not_json_serializable():
     assert "JSON-serializable" in msg
 
 
+def test_validate_matches_stdlib_json_verdicts():
+    import dataclasses
+    import datetime
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    assert validate_visual_spec({"render": "bar", "data": {"p": Point(1)}})[0] is False
+    assert validate_visual_spec({"render": "bar", "data": {"d": datetime.date(2024, 1, 1)}})[0] is False
+    assert validate_visual_spec({"render": "bar", "data": {1: [2**70]}}) == (True, None)
+
+
+def test_validate_rejects_enum_and_uuid_like_stdlib_json():
+    import enum
+    import uuid
+
+    class Color(enum.Enum):
+        RED = "red"
+
+    class Level(enum.IntEnum):
+        HIGH = 2
+
+    assert validate_visual_spec({"render": "bar", "data": {"c": Color.RED}})[0] is False
+    assert validate_visual_spec({"render": "bar", "data": {"u": uuid.uuid4()}})[0] is False
+    assert validate_visual_spec({"render": "bar", "data": {Color.RED: 1}})[0] is False
+    assert validate_visual_spec({"render": "bar", "data": {"l": Level.HIGH}}) == (True, None)
+    shared = [1, 2]
+    assert validate_visual_spec({"render": "bar", "data": {"a": shared, "b": shared}}) == (True, None)
+
+
 def test_validate_valid():
     ok, msg = validate_visual_spec({"render": "bar", "data": {"x": 1}})
     assert ok is True
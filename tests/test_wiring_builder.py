@@ -74,3 +74,42 @@ def test_wiring_builder_connects_by_names_and_topics(biosim):
 
     assert calls["lgn"] >= 1
     assert calls["sc"] >= 1
+
+
+def test_wiring_builder_connect_many_queues_all_edges(biosim):
+    scalar = biosim.SignalSpec.scalar(dtype="float64")
+
+    class Source(biosim.BioModule):
+        def outputs(self):
+            return {"out": scalar}
+
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    class Sink(biosim.BioModule):
+        input_calls = 0
+
+        def inputs(self):
+            Sink.input_calls += 1
+            return {"a": scalar, "b": scalar}
+
+        def advance_window(self, start, end):
+            return None
+
+        def get_outputs(self):
+            return {}
+
+    world = biosim.BioWorld(communication_step=1.0)
+    wb = biosim.WiringBuilder(world)
+    wb.add("src", Source()).add("dst", Sink())
+    assert Sink.input_calls == 1
+    wb.connect_many(iter([("src.out", ("dst.a",)), ("src.out", ["dst.b"])])).apply()
+
+    connections = world._connections_by_target["dst"]
+    assert [conn.target_signal for conn in connections] == ["a", "b"]
+    assert wb._pending_connections == []
+    # apply() normalizes dst's declared inputs once for both edges.
+    assert Sink.input_calls == 2
@@ -9,29 +9,34 @@ from biosim.wiring import (
     load_wiring,
     load_wiring_yaml,
 )
+from biosim.modules import BioModule
+from biosim.signals import SignalSpec
 from biosim.world import BioWorld
 
 
-def _make_module(biosim, inputs_set=None, outputs_set=None):
-    scalar = biosim.SignalSpec.scalar(dtype="float64")
+_SCALAR = SignalSpec.scalar(dtype="float64")
+
 
-    class M(biosim.BioModule):
-        def __init__(self):
-            pass
+class _StubModule(BioModule):
+    def __init__(self, inputs_set=None, outputs_set=None):
+        self._inputs = {name: _SCALAR for name in (inputs_set or set())}
+        self._outputs = {name: _SCALAR for name in (outputs_set or {"x"})}
 
-        def advance_window(self, _start, t):
-            pass
+    def advance_window(self, _start, t):
+        pass
 
-        def get_outputs(self):
-            return {}
+    def get_outputs(self):
+        return {}
 
-        def inputs(self):
-            return {name: scalar for name in (inputs_set or set())}
+    def inputs(self):
+        return self._inputs
 
-        def outputs(self):
-            return {name: scalar for name in (outputs_set or {"x"})}
+    def outputs(self):
+        return self._outputs
 
-    return M()
+
+def _make_module(biosim, inputs_set=None, outputs_set=None):
+    return _StubModule(inputs_set, outputs_set)
 
 
 def test_parse_ref_valid():
@@ -60,3 +60,34 @@ def test_build_from_spec_with_preadded_modules(biosim):
     }
     biosim.build_from_spec(world, spec)
     world.run(duration=0.1)
+
+
+def test_load_wiring_yaml_reuses_parse_until_file_changes(tmp_path: Path, biosim, monkeypatch):
+    import os
+
+    import yaml
+
+    from biosim import wiring
+
+    Eye, LGN, SC = _common_modules(biosim)
+    path = tmp_path / "wiring.yaml"
+    path.write_text(
+        f"modules:\n  eye: {Eye.__module__}.{Eye.__name__}\n  lgn: {LGN.__module__}.{LGN.__name__}\n"
+        "wiring:\n  - from: eye.visual_stream\n    to: [lgn.retina]\n"
+    )
+    loads = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: loads.append(1) or real_load(*args, **kwargs))
+    wiring._parse_wiring_file.cache_clear()
+
+    biosim.load_wiring_yaml(biosim.BioWorld(communication_step=0.1), path)
+    biosim.load_wiring_yaml(biosim.BioWorld(communication_step=0.1), path)
+    assert len(loads) == 1
+
+    stat = path.stat()
+    path.write_text(path.read_text() + "  - from: eye.visual_stream\n    to: [lgn.retina]\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    world = biosim.BioWorld(communication_step=0.1)
+    biosim.load_wiring_yaml(world, path)
+    assert len(loads) == 2
+    assert len(world._connections_by_target["lgn"]) == 2
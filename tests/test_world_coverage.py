@@ -6,6 +6,7 @@ import threading
 
 import pytest
 
+from biosim.modules import BioModule
 from biosim.world import BioWorld, WorldEvent
 
 
@@ -13,15 +14,16 @@ def _scalar_spec(biosim, **kwargs):
     return biosim.SignalSpec.scalar(dtype="float64", **kwargs)
 
 
-def _make_module(biosim):
-    class M(biosim.BioModule):
-        def advance_window(self, start, end):
-            return
+class _StubModule(BioModule):
+    def advance_window(self, start, end):
+        return
 
-        def get_outputs(self):
-            return {}
+    def get_outputs(self):
+        return {}
 
-    return M()
+
+def _make_module(biosim):
+    return _StubModule()
 
 
 def test_listener_off_nonexistent(biosim):
@@ -47,6 +49,52 @@ def test_listener_error_is_logged(biosim, caplog):
     assert any("world listener raised" in record.message for record in caplog.records)
 
 
+def test_repeated_listener_errors_are_logged_a_bounded_number_of_times(biosim, caplog):
+    from biosim.world import MAX_LOGGED_LISTENER_FAILURES
+
+    world = BioWorld(communication_step=0.1)
+    world.add_biomodule("m", _make_module(biosim))
+
+    def bad_listener(_ev, _data):
+        raise RuntimeError("boom")
+
+    world.on(bad_listener)
+    world.run(duration=1.0)
+
+    raised = [record for record in caplog.records if "world listener raised" in record.message]
+    assert len(raised) == MAX_LOGGED_LISTENER_FAILURES
+    assert any("suppressing further errors" in record.message for record in caplog.records)
+
+
+def test_repeated_visualize_errors_are_logged_a_bounded_number_of_times(biosim, caplog):
+    from biosim.world import MAX_LOGGED_VISUALIZE_FAILURES
+
+    class Flaky(biosim.BioModule):
+        calls = 0
+
+        def advance_window(self, start, end):
+            return
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            Flaky.calls += 1
+            if Flaky.calls <= 5:
+                raise RuntimeError("not ready")
+            return {"render": "text", "data": {"text": "ok"}}
+
+    world = BioWorld(communication_step=0.1)
+    world.add_biomodule("flaky", Flaky())
+
+    for _ in range(5):
+        assert world.collect_visuals() == []
+    assert world.collect_visuals() == [{"module": "flaky", "visuals": [{"render": "text", "data": {"text": "ok"}}]}]
+
+    raised = [record for record in caplog.records if "visualize raised" in record.message]
+    assert len(raised) == MAX_LOGGED_VISUALIZE_FAILURES
+
+
 def test_add_duplicate_module_same_instance_is_allowed(biosim):
     world = BioWorld(communication_step=0.1)
     module = _make_module(biosim)
@@ -291,6 +339,19 @@ def test_run_auto_setup_and_tick_payloads(biosim):
     assert any(ev == WorldEvent.FINISHED for ev, _ in events)
 
 
+def test_window_boundaries_follow_grid_from_run_start(biosim):
+    events = []
+    world = BioWorld(communication_step=0.1)
+    world.add_biomodule("m", _make_module(biosim))
+    world.on(lambda ev, payload: events.append((ev, payload)))
+
+    world.run(duration=1.0)
+
+    ends = [payload["window_end"] for ev, payload in events if ev == WorldEvent.STEP]
+    assert ends == [k * 0.1 for k in range(1, 10)] + [1.0]
+    assert world.current_time == 1.0
+
+
 def test_request_stop_emits_stopped(biosim):
     events = []
     world = BioWorld(communication_step=0.1)
@@ -528,6 +589,54 @@ def test_stale_policy_error_raises(biosim):
         world.run(duration=0.2)
 
 
+def test_readding_module_rebinds_connection_target_spec(biosim):
+    src_spec = _scalar_spec(biosim)
+    strict_spec = _scalar_spec(biosim, max_age=0.05, stale_policy="error")
+
+    class Src(biosim.BioModule):
+        def __init__(self):
+            self._outputs = {
+                "state": biosim.ScalarSignal(source="src", name="state", value=1.0, emitted_at=0.0, spec=src_spec)
+            }
+
+        def outputs(self):
+            return {"state": src_spec}
+
+        def advance_window(self, start, end):
+            return
+
+        def get_outputs(self):
+            return dict(self._outputs)
+
+    class Dst(biosim.BioModule):
+        def __init__(self):
+            self.spec = src_spec
+
+        def inputs(self):
+            return {"state": self.spec}
+
+        def set_inputs(self, signals):
+            return
+
+        def advance_window(self, start, end):
+            return
+
+        def get_outputs(self):
+            return {}
+
+    dst = Dst()
+    world = BioWorld(communication_step=0.1)
+    world.add_biomodule("src", Src())
+    world.add_biomodule("dst", dst)
+    world.connect("src.state", "dst.state")
+
+    dst.spec = strict_spec
+    world.add_biomodule("dst", dst)
+
+    with pytest.raises(ValueError, match="stale signal read"):
+        world.run(duration=0.2)
+
+
 def test_empty_outputs_do_not_clear_signal_store(biosim):
     scalar = _scalar_spec(biosim)
 
@@ -689,3 +798,36 @@ def test_snapshot_restore_and_branch_preserve_world_state(biosim):
 
     world.run(duration=0.1)
     assert world.get_outputs("counter")["count"].value == 3
+
+
+def test_branch_copies_array_signals_without_sharing_buffers(biosim):
+    import numpy as np
+
+    spec = biosim.SignalSpec.array(dtype="float64", shape=(3,))
+
+    class Src(biosim.BioModule):
+        def __init__(self):
+            self._out = {}
+
+        def outputs(self):
+            return {"x": spec}
+
+        def advance_window(self, start, end):
+            self._out = {
+                "x": biosim.ArraySignal(source="src", name="x", value=np.arange(3.0), emitted_at=end, spec=spec)
+            }
+
+        def get_outputs(self):
+            return self._out
+
+    world = BioWorld(communication_step=0.1)
+    world.add_biomodule("src", Src())
+    world.run(duration=0.1)
+
+    branched = world.branch()
+    original = world.get_outputs("src")["x"]
+    copied = branched.get_outputs("src")["x"]
+    assert isinstance(copied, biosim.ArraySignal)
+    assert copied.spec == original.spec
+    np.testing.assert_array_equal(copied.value, original.value)
+    assert not np.shares_memory(copied.value, original.value)